@@ -4,6 +4,7 @@ Health Check System
 Production health checks for all components.
 """
 
+import asyncio
 from typing import Dict, List, Optional, Callable
 from dataclasses import dataclass
 from enum import Enum
@@ -45,6 +46,9 @@ class HealthCheck:
         # Run all checks
         status = health.check_all()
         
+        # Or concurrently, from async code
+        status = await health.check_all_async()
+        
         # Check specific component
         db_health = health.check("database")
     """
@@ -114,6 +118,20 @@ class HealthCheck:
         
         return results
     
+    async def check_all_async(self) -> Dict[str, ComponentHealth]:
+        """
+        Run all health checks concurrently.
+        
+        Each check runs in a worker thread, so one slow probe doesn't hold up
+        the others and the event loop stays free; wall time is roughly that of
+        the slowest check.
+        """
+        names = list(self.checks)
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.check, name) for name in names)
+        )
+        return dict(zip(names, results))
+    
     def is_healthy(self) -> bool:
         """Check if all components are healthy."""
         results = self.check_all()
@@ -1,6 +1,7 @@
 """Metrics Collection (integrated with telemetry/)"""
 from enum import Enum
 from dataclasses import dataclass
+from typing import Dict
 
 class MetricType(Enum):
     COUNTER = "counter"
@@ -17,4 +18,9 @@ class MetricsCollector:
     """Metrics collector (see telemetry/metrics.py for full implementation)"""
     def record_latency(self, name: str, value: float):
         pass
+    
+    def record_batch(self, latencies: Dict[str, float]):
+        """Record several latencies (name -> value) in one call."""
+        for name, value in latencies.items():
+            self.record_latency(name, value)
 
@@ -270,26 +270,30 @@ class UniversalOutput(BaseModel):
 # Helper Functions
 # ============================================================================
 
+# Level -> schema maps, built once at import (schemas are complete at class
+# creation, so their validators are already compiled by this point)
+_INPUT_SCHEMAS = {
+    1: ChatInput,
+    2: ContextAwareInput,
+    3: APIRequest,
+    4: WorkflowInput,
+    5: CollaborationRequest
+}
+
+_OUTPUT_SCHEMAS = {
+    1: ChatOutput,
+    2: ContextAwareOutput,
+    3: APIResponse,
+    4: WorkflowOutput,
+    5: CollaborationResponse
+}
+
+
 def get_input_schema_for_level(level: int):
     """Get appropriate input schema for learning level."""
-    schemas = {
-        1: ChatInput,
-        2: ContextAwareInput,
-        3: APIRequest,
-        4: WorkflowInput,
-        5: CollaborationRequest
-    }
-    return schemas.get(level, UniversalInput)
+    return _INPUT_SCHEMAS.get(level, UniversalInput)
 
 
 def get_output_schema_for_level(level: int):
     """Get appropriate output schema for learning level."""
-    schemas = {
-        1: ChatOutput,
-        2: ContextAwareOutput,
-        3: APIResponse,
-        4: WorkflowOutput,
-        5: CollaborationResponse
-    }
-    return schemas.get(level, UniversalOutput)
-
+    return _OUTPUT_SCHEMAS.get(level, UniversalOutput)
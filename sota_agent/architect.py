@@ -23,12 +23,19 @@ Usage:
 
 import re
 import os
+import hashlib
+import argparse
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
 
 
+# Most file digests DocumentParser remembers before evicting the least recent
+_DIGEST_CACHE_SIZE = 256
+
+
 class DocumentParser:
     """
     Parse documents of various formats to extract text for analysis.
@@ -38,8 +45,18 @@ class DocumentParser:
     - Markdown (.md)
     - PDF (.pdf) - requires PyPDF2
     - Word (.docx, .doc) - requires python-docx
+    
+    PDF and Word extraction is cached on disk by file checksum, under
+    ``$XDG_CACHE_HOME/sota_agent/docs`` (``~/.cache`` by default) or
+    ``DocumentParser.cache_dir`` when set.
     """
     
+    # Overrides the on-disk cache location (e.g. a tmp dir in tests)
+    cache_dir: Optional[Path] = None
+    
+    # path -> (mtime_ns, size, digest); skips re-hashing files that haven't changed
+    _digests: "OrderedDict[str, Tuple[int, int, str]]" = OrderedDict()
+    
     @staticmethod
     def validate_file(file_path: str) -> tuple[bool, str]:
         """
@@ -113,11 +130,11 @@ class DocumentParser:
         
         # PDF
         elif suffix == '.pdf':
-            return DocumentParser._parse_pdf(path)
+            return DocumentParser._parse_cached(path, DocumentParser._parse_pdf)
         
         # Word documents
         elif suffix in ['.docx', '.doc']:
-            return DocumentParser._parse_docx(path)
+            return DocumentParser._parse_cached(path, DocumentParser._parse_docx)
         
         else:
             raise ValueError(
@@ -125,6 +142,52 @@ class DocumentParser:
                 f"Supported: .txt, .md, .pdf, .docx, .doc"
             )
     
+    @staticmethod
+    def _cache_root() -> Path:
+        """Directory holding cached extractions, one ``<digest>.txt`` per document."""
+        if DocumentParser.cache_dir is not None:
+            return Path(DocumentParser.cache_dir)
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+        return Path(base) / "sota_agent" / "docs"
+    
+    @staticmethod
+    def _file_digest(path: Path) -> str:
+        """128-bit blake2b of the file bytes, reused while mtime and size are unchanged."""
+        st = path.stat()
+        key = str(path.resolve())
+        digests = DocumentParser._digests
+        known = digests.get(key)
+        if known and known[0] == st.st_mtime_ns and known[1] == st.st_size:
+            digests.move_to_end(key)
+            return known[2]
+        digest = hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+        digests[key] = (st.st_mtime_ns, st.st_size, digest)
+        digests.move_to_end(key)
+        if len(digests) > _DIGEST_CACHE_SIZE:
+            digests.popitem(last=False)
+        return digest
+    
+    @staticmethod
+    def _parse_cached(path: Path, parse) -> str:
+        """Run ``parse(path)`` once per distinct file content, caching the text on disk."""
+        cached = DocumentParser._cache_root() / f"{DocumentParser._file_digest(path)}.txt"
+        try:
+            return cached.read_text(encoding="utf-8")
+        except OSError:
+            pass
+        
+        text = parse(path)
+        
+        # Best effort: an unwritable cache dir just means no caching
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cached.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(text, encoding="utf-8")
+            os.replace(tmp, cached)
+        except OSError:
+            pass
+        return text
+    
     @staticmethod
     def _parse_text(path: Path) -> str:
         """Parse plain text or markdown file."""
@@ -339,12 +402,24 @@ class ArchitectureAdvisor:
         print("⚠️  Recommendations are guidance - choose what fits your needs")
         print("="*80 + "\n")
     
+    # (complexity, feature, domain) pattern tables, compiled once per process
+    _pattern_tables: Optional[Tuple[Dict, Dict, Dict]] = None
+    
     def __init__(self):
         """Initialize the advisor with pattern matchers and rules."""
+        cls = type(self)
+        if cls._pattern_tables is None:
+            cls._pattern_tables = cls._build_pattern_tables()
+        # Shared across instances; analysis only reads them
+        self.complexity_patterns, self.feature_patterns, self.domain_patterns = cls._pattern_tables
+    
+    @staticmethod
+    def _build_pattern_tables() -> Tuple[Dict, Dict, Dict]:
+        """Build and compile the complexity, feature and domain pattern tables."""
         
         # Complexity indicators (patterns that suggest higher complexity)
         # Focus on implementation requirements, not aspirational buzzwords
-        self.complexity_patterns = {
+        complexity_patterns = {
             ComplexityLevel.SIMPLE: [
                 r'\bsimple\b', r'\bbasic\b', r'\bquick\b', r'\bchatbot\b',
                 r'\bfaq\b', r'\bquestion.?answer', r'\brespond\b',
@@ -417,7 +492,7 @@ class ArchitectureAdvisor:
         }
         
         # Feature indicators - focus on actual implementation needs
-        self.feature_patterns = {
+        feature_patterns = {
             'memory': [
                 r'\bstore\s+.{0,20}(history|context|data|progress)',
                 r'\bremember\s+.{0,20}(previous|past|earlier|what|topic)',
@@ -485,7 +560,7 @@ class ArchitectureAdvisor:
         }
         
         # Domain indicators
-        self.domain_patterns = {
+        domain_patterns = {
             'fraud': [r'\bfraud\b', r'\bscam\b', r'\brisk\b', r'\bsuspicious\b'],
             'customer_support': [r'\bsupport\b', r'\bticket\b', r'\bhelp.?desk\b', r'\bcustomer\b'],
             'analytics': [r'\banalytics\b', r'\binsight\b', r'\bdata\b', r'\breport\b'],
@@ -495,6 +570,13 @@ class ArchitectureAdvisor:
             'hr': [r'\bhr\b', r'\brecruit', r'\bhiring\b', r'\bemployee\b'],
             'legal': [r'\blegal\b', r'\bcontract\b', r'\bcompliance\b', r'\bregulatr']
         }
+        
+        # Compile every pattern once up front; analysis runs each of them per brief
+        tables = (complexity_patterns, feature_patterns, domain_patterns)
+        for table in tables:
+            for key, patterns in table.items():
+                table[key] = [re.compile(pattern) for pattern in patterns]
+        return tables
     
     def analyze_brief(self, brief: str) -> ArchitectureRecommendation:
         """
@@ -629,7 +711,7 @@ class ArchitectureAdvisor:
         
         # Score each level based on pattern matches
         for level, patterns in self.complexity_patterns.items():
-            score = sum(1 for pattern in patterns if re.search(pattern, brief))
+            score = sum(1 for pattern in patterns if pattern.search(brief))
             scores[level] = score
         
         # Get level with highest score
@@ -654,7 +736,7 @@ class ArchitectureAdvisor:
         features = []
         
         for feature, patterns in self.feature_patterns.items():
-            if any(re.search(pattern, brief) for pattern in patterns):
+            if any(pattern.search(brief) for pattern in patterns):
                 features.append(feature)
         
         # Add default features based on level
@@ -678,13 +760,13 @@ class ArchitectureAdvisor:
         integrations = []
         
         # Check for explicit integration mentions
-        if any(re.search(pattern, brief) for pattern in self.feature_patterns['mcp']):
+        if any(pattern.search(brief) for pattern in self.feature_patterns['mcp']):
             integrations.append('MCP')
         
-        if any(re.search(pattern, brief) for pattern in self.feature_patterns['a2a']):
+        if any(pattern.search(brief) for pattern in self.feature_patterns['a2a']):
             integrations.append('A2A')
         
-        if any(re.search(pattern, brief) for pattern in self.feature_patterns['databricks']):
+        if any(pattern.search(brief) for pattern in self.feature_patterns['databricks']):
             integrations.append('Databricks')
         
         # Add LangGraph for Advanced+ levels
@@ -710,7 +792,7 @@ class ArchitectureAdvisor:
         domain_scores = {}
         
         for domain, patterns in self.domain_patterns.items():
-            score = sum(1 for pattern in patterns if re.search(pattern, brief))
+            score = sum(1 for pattern in patterns if pattern.search(brief))
             if score > 0:
                 domain_scores[domain] = score
         
@@ -934,11 +1016,8 @@ class ArchitectureAdvisor:
         print()
 
 
-def main():
-    """CLI entry point for architecture advisor."""
-    import sys
-    import argparse
-    
+def build_parser() -> argparse.ArgumentParser:
+    """Build the agent-architect argument parser."""
     parser = argparse.ArgumentParser(
         description='Agent Framework Architecture Advisor',
         epilog='Examples:\n'
@@ -973,6 +1052,14 @@ def main():
         help='Output as JSON (non-interactive)'
     )
     
+    return parser
+
+
+def main():
+    """CLI entry point for architecture advisor."""
+    import sys
+    
+    parser = build_parser()
     args = parser.parse_args()
     
     advisor = ArchitectureAdvisor()
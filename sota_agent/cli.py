@@ -5,8 +5,8 @@ import sys
 from .generator import generate_project
 
 
-def main():
-    """Main CLI entry point."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the agent-generate argument parser."""
     parser = argparse.ArgumentParser(
         description="Agent Framework - Generate AI agent projects for any domain",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -60,7 +60,12 @@ For more information, visit: https://github.com/somasekar278/universal-agent-tem
         version="Agent Framework 0.2.0"
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    args = build_parser().parse_args()
     
     # Generate the project
     try:
@@ -7,6 +7,7 @@ from simple chatbot to autonomous multi-agent systems.
 """
 
 import sys
+import argparse
 from pathlib import Path
 from typing import Optional
 import shutil
@@ -608,10 +609,8 @@ def create_level5_files(output_path: Path):
     (output_path / "README.md").write_text("# Level 5: Autonomous Multi-Agent\n\nComing soon...")
 
 
-def main():
-    """Main CLI entry point"""
-    import argparse
-    
+def build_parser() -> argparse.ArgumentParser:
+    """Build the agent-learn argument parser."""
     parser = argparse.ArgumentParser(
         description="Agent Framework - Interactive Learning Mode",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -646,6 +645,12 @@ Learn by building: From simple chatbot to autonomous multi-agent system!
         help="Output directory for project"
     )
     
+    return parser
+
+
+def main():
+    """Main CLI entry point"""
+    parser = build_parser()
     args = parser.parse_args()
     
     print_banner()
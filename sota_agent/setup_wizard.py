@@ -10,6 +10,7 @@ Interactive wizard that guides users through framework setup:
 
 import os
 import sys
+import argparse
 from typing import Dict, Any, List, Optional
 from enum import Enum
 import yaml
@@ -553,8 +554,19 @@ class FrameworkSetupWizard:
             yaml.dump(experiments_yaml, f, default_flow_style=False)
 
 
+def build_parser() -> argparse.ArgumentParser:
+    """Build the agent-setup argument parser."""
+    return argparse.ArgumentParser(
+        description="Agent Framework - Setup Wizard",
+        epilog="Interactive wizard that guides you through agent project setup "
+               "(runs with recommended defaults when stdin is not a terminal)."
+    )
+
+
 def main():
     """Main entry point for setup wizard."""
+    build_parser().parse_args()
+    
     wizard = FrameworkSetupWizard()
     
     # Check if running interactively
@@ -7,26 +7,140 @@ Usage:
     python test_framework.py              # Run all tests
     python test_framework.py --quick      # Quick smoke tests only
     python test_framework.py --module memory  # Test specific module
+    python test_framework.py --verbose    # Recap failed/skipped checks in the summary
+    python test_framework.py --serve      # Keep a warm tester running for --module calls
 """
 
+import os
+import io
 import sys
+import stat
+import socket
+import tempfile
 import importlib
-import subprocess
+import importlib.util
+import contextlib
+import socketserver
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
 import json
 
 
+def _runtime_dir() -> str:
+    """Per-user directory for the tester socket: $XDG_RUNTIME_DIR, else a uid-named temp dir."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return runtime_dir
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(tempfile.gettempdir(), f"agent-framework-tester-{uid}")
+
+
+# Where `--serve` listens and `--module` looks for a warm tester process
+DEFAULT_SOCKET = os.path.join(_runtime_dir(), "agent-framework-tester.sock")
+
+# Seconds `--module` waits on a warm tester before running the test itself
+_REQUEST_TIMEOUT = 120.0
+
+# Repository root; modules loaded from under it are re-imported for every served request
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+# Prebuilt pydantic validators, keyed by schema name (filled on first use)
+_ADAPTERS: Dict[str, Any] = {}
+
+
+# (schema name, sample payload) pairs checked by FrameworkTester.test_schemas
+_SCHEMA_FIXTURES: List[Tuple[str, Dict[str, Any]]] = [
+    ("ChatInput", {"question": "test", "user_id": "user1"}),
+    ("ChatOutput", {"answer": "test", "confidence": 0.9}),
+    ("ContextAwareInput", {
+        "message": "test", "user_id": "user1", "session_id": "sess1"
+    }),
+    ("APIRequest", {
+        "endpoint": "test", "data": {}, "request_id": "req1"
+    }),
+    ("APIResponse", {
+        "success": True, "request_id": "req1", "processing_time_ms": 10.0
+    }),
+]
+
+
+def _iter_schemas():
+    """Yield (name, class, payload), importing the schema module only when iterated."""
+    module = importlib.import_module("shared.schemas.learning")
+    for name, data in _SCHEMA_FIXTURES:
+        yield name, getattr(module, name), data
+
+
+def _schema_adapter(name: str, schema_class: type):
+    """Return a cached TypeAdapter so each schema's core validator is built once."""
+    adapter = _ADAPTERS.get(name)
+    if adapter is None:
+        from pydantic import TypeAdapter
+        adapter = _ADAPTERS[name] = TypeAdapter(schema_class)
+    return adapter
+
+
+# Process-wide advisor, shared by every FrameworkTester (see _get_advisor)
+_ADVISOR = None
+
+
+def _get_advisor():
+    """Return the shared ArchitectureAdvisor, building it on first use."""
+    global _ADVISOR
+    if _ADVISOR is None:
+        from sota_agent.architect import ArchitectureAdvisor
+        _ADVISOR = ArchitectureAdvisor()
+    return _ADVISOR
+
+
+# Indexes into FrameworkTester.counts
+PASSED, FAILED, SKIPPED = 0, 1, 2
+
+
+@lru_cache(maxsize=None)
+def _find_spec(name: str):
+    """Memoized importlib.util.find_spec; each lookup walks sys.path finders."""
+    return importlib.util.find_spec(name)
+
+
 class FrameworkTester:
     """Comprehensive framework testing without building full agents."""
     
-    def __init__(self):
-        self.results = {
-            "passed": 0,
-            "failed": 0,
-            "skipped": 0,
-            "details": []
-        }
+    def __init__(self, verbose: bool = False):
+        # Passed/failed/skipped tallies, indexed by PASSED, FAILED and SKIPPED
+        self.counts = [0, 0, 0]
+        # Per-check (status, line) records are only kept when asked for
+        self.verbose = verbose
+        self.details: List[Tuple[int, str]] = []
+        self._arch_cache: Dict[str, Any] = {}
+        # Result lines for the current test group, written out in one go by _flush()
+        self._buf: List[str] = []
+    
+    def _emit(self, line: str = ""):
+        """Queue a result line for the current test group."""
+        self._buf.append(line)
+    
+    def _record(self, status: int, line: str):
+        """Emit a result line and count it under PASSED, FAILED or SKIPPED."""
+        self._buf.append(line)
+        self.counts[status] += 1
+        if self.verbose:
+            self.details.append((status, line))
+    
+    def reset(self):
+        """Clear counts and details so the next run reports only its own results."""
+        self.counts = [0, 0, 0]
+        self.details.clear()
+    
+    def _flush(self):
+        """Write all queued lines with a single stdout write."""
+        if self._buf:
+            sys.stdout.write("\n".join(self._buf) + "\n")
+            sys.stdout.flush()
+            self._buf.clear()
     
     def run_all_tests(self, quick: bool = False):
         """Run all framework tests."""
@@ -56,8 +170,9 @@ class FrameworkTester:
             try:
                 test_func()
             except Exception as e:
-                print(f"❌ {test_name} FAILED: {e}")
-                self.results["failed"] += 1
+                self._record(FAILED, f"❌ {test_name} FAILED: {e}")
+            finally:
+                self._flush()
         
         self.print_summary()
     
@@ -78,98 +193,58 @@ class FrameworkTester:
             "sota_agent.architect",
         ]
         
-        print(f"\nTesting {len(modules)} module imports...\n")
+        self._emit(f"\nTesting {len(modules)} module imports...\n")
         
         for module in modules:
             try:
                 importlib.import_module(module)
-                print(f"  ✅ {module}")
-                self.results["passed"] += 1
+                self._record(PASSED, f"  ✅ {module}")
             except ImportError as e:
-                print(f"  ❌ {module}: {e}")
-                self.results["failed"] += 1
+                self._record(FAILED, f"  ❌ {module}: {e}")
             except Exception as e:
-                print(f"  ⚠️  {module}: {e}")
-                self.results["skipped"] += 1
+                self._record(SKIPPED, f"  ⚠️  {module}: {e}")
     
     def test_cli_tools(self):
         """Test that CLI tools are accessible."""
         cli_tools = [
-            ("agent-architect", "architect", ["--help"], ["usage", "brief"]),
-            ("agent-learn", "learn", ["--help"], ["usage", "level", "learning"]),
-            ("agent-setup", "setup_wizard", [], ["setup", "wizard", "agent"]),
-            ("agent-generate", "cli", ["--help"], ["usage", "domain", "generate"]),
+            ("agent-architect", "architect", ["usage", "brief"]),
+            ("agent-learn", "learn", ["usage", "level", "learning"]),
+            ("agent-setup", "setup_wizard", ["setup", "wizard", "agent"]),
+            ("agent-generate", "cli", ["usage", "domain", "generate"]),
         ]
         
-        print(f"\nTesting {len(cli_tools)} CLI tools...\n")
+        self._emit(f"\nTesting {len(cli_tools)} CLI tools...\n")
         
-        for tool_name, module_name, args, expected_keywords in cli_tools:
+        # Build each tool's parser in-process instead of paying interpreter
+        # startup for a `--help` subprocess per tool
+        for tool_name, module_name, expected_keywords in cli_tools:
             try:
-                cmd = [sys.executable, "-m", f"sota_agent.{module_name}"] + args
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                
-                output = result.stdout.lower() + result.stderr.lower()
+                module = importlib.import_module(f"sota_agent.{module_name}")
+                help_text = module.build_parser().format_help().lower()
                 
                 # Check if any expected keyword is in output
-                if any(keyword in output for keyword in expected_keywords):
-                    print(f"  ✅ {tool_name}")
-                    self.results["passed"] += 1
+                if any(keyword in help_text for keyword in expected_keywords):
+                    self._record(PASSED, f"  ✅ {tool_name}")
                 else:
-                    print(f"  ❌ {tool_name}: No expected output found")
-                    self.results["failed"] += 1
+                    self._record(FAILED, f"  ❌ {tool_name}: No expected output found")
                     
-            except subprocess.TimeoutExpired:
-                print(f"  ⚠️  {tool_name}: Timeout")
-                self.results["skipped"] += 1
             except Exception as e:
-                print(f"  ❌ {tool_name}: {e}")
-                self.results["failed"] += 1
+                self._record(FAILED, f"  ❌ {tool_name}: {e}")
     
     def test_schemas(self):
         """Test that all schema classes can be instantiated."""
-        from shared.schemas.learning import (
-            ChatInput, ChatOutput,
-            ContextAwareInput, ContextAwareOutput,
-            APIRequest, APIResponse,
-            WorkflowInput, WorkflowOutput,
-            CollaborationRequest, CollaborationResponse
-        )
-        
-        schemas_to_test = [
-            ("ChatInput", ChatInput, {"question": "test", "user_id": "user1"}),
-            ("ChatOutput", ChatOutput, {"answer": "test", "confidence": 0.9}),
-            ("ContextAwareInput", ContextAwareInput, {
-                "message": "test", "user_id": "user1", "session_id": "sess1"
-            }),
-            ("APIRequest", APIRequest, {
-                "endpoint": "test", "data": {}, "request_id": "req1"
-            }),
-            ("APIResponse", APIResponse, {
-                "success": True, "request_id": "req1", "processing_time_ms": 10.0
-            }),
-        ]
+        self._emit(f"\nTesting {len(_SCHEMA_FIXTURES)} schema validations...\n")
         
-        print(f"\nTesting {len(schemas_to_test)} schema validations...\n")
-        
-        for schema_name, schema_class, test_data in schemas_to_test:
+        for schema_name, schema_class, test_data in _iter_schemas():
             try:
-                instance = schema_class(**test_data)
+                instance = _schema_adapter(schema_name, schema_class).validate_python(test_data)
                 assert instance is not None
-                print(f"  ✅ {schema_name}")
-                self.results["passed"] += 1
+                self._record(PASSED, f"  ✅ {schema_name}")
             except Exception as e:
-                print(f"  ❌ {schema_name}: {e}")
-                self.results["failed"] += 1
+                self._record(FAILED, f"  ❌ {schema_name}: {e}")
     
     def test_architect(self):
         """Test architecture advisor with sample briefs."""
-        from sota_agent.architect import ArchitectureAdvisor
-        
         test_briefs = [
             ("Simple chatbot", "Build a simple FAQ bot", 1),
             ("Context-aware", "Assistant that remembers user preferences", 2),
@@ -178,22 +253,25 @@ class FrameworkTester:
             ("Multi-agent", "Multiple autonomous agents that communicate and coordinate with each other", 5),
         ]
         
-        print(f"\nTesting architect with {len(test_briefs)} briefs...\n")
-        
-        advisor = ArchitectureAdvisor()
+        self._emit(f"\nTesting architect with {len(test_briefs)} briefs...\n")
         
         for test_name, brief, expected_level in test_briefs:
             try:
-                recommendation = advisor.analyze_brief(brief)
+                recommendation = self._analyze_brief(brief)
                 if recommendation.level.value == expected_level:
-                    print(f"  ✅ {test_name} → Level {recommendation.level.value} (confidence: {recommendation.confidence:.0%})")
-                    self.results["passed"] += 1
+                    self._record(PASSED, f"  ✅ {test_name} → Level {recommendation.level.value} (confidence: {recommendation.confidence:.0%})")
                 else:
-                    print(f"  ⚠️  {test_name} → Level {recommendation.level.value} (expected {expected_level}, confidence: {recommendation.confidence:.0%})")
-                    self.results["skipped"] += 1
+                    self._record(SKIPPED, f"  ⚠️  {test_name} → Level {recommendation.level.value} (expected {expected_level}, confidence: {recommendation.confidence:.0%})")
             except Exception as e:
-                print(f"  ❌ {test_name}: {e}")
-                self.results["failed"] += 1
+                self._record(FAILED, f"  ❌ {test_name}: {e}")
+    
+    def _analyze_brief(self, brief: str):
+        """Analyze a brief with the shared advisor, memoizing recommendations by brief text."""
+        recommendation = self._arch_cache.get(brief)
+        if recommendation is None:
+            recommendation = _get_advisor().analyze_brief(brief)
+            self._arch_cache[brief] = recommendation
+        return recommendation
     
     def test_examples(self):
         """Test that example files can be imported."""
@@ -202,21 +280,25 @@ class FrameworkTester:
             "examples.a2a_official_example",
         ]
         
-        print(f"\nTesting {len(examples)} example files...\n")
+        self._emit(f"\nTesting {len(examples)} example files...\n")
+        
+        # Resolve the parent package once so leaf lookups reuse its cached finder
+        importlib.invalidate_caches()
+        try:
+            _find_spec("examples")
+        except Exception:
+            pass
         
         for example in examples:
             try:
                 # Just try to import, don't run
-                spec = importlib.util.find_spec(example)
+                spec = _find_spec(example)
                 if spec is not None:
-                    print(f"  ✅ {example}")
-                    self.results["passed"] += 1
+                    self._record(PASSED, f"  ✅ {example}")
                 else:
-                    print(f"  ❌ {example}: Not found")
-                    self.results["failed"] += 1
+                    self._record(FAILED, f"  ❌ {example}: Not found")
             except Exception as e:
-                print(f"  ⚠️  {example}: {e}")
-                self.results["skipped"] += 1
+                self._record(SKIPPED, f"  ⚠️  {example}: {e}")
     
     def test_documentation(self):
         """Test that key documentation files exist."""
@@ -230,21 +312,33 @@ class FrameworkTester:
             "docs/INTEGRATIONS.md",
         ]
         
-        print(f"\nTesting {len(docs)} documentation files...\n")
+        self._emit(f"\nTesting {len(docs)} documentation files...\n")
         
+        # One directory listing per parent dir instead of exists()+stat() per file
+        by_dir: Dict[str, set] = defaultdict(set)
         for doc in docs:
-            path = Path(doc)
-            if path.exists():
+            by_dir[os.path.dirname(doc) or "."].add(os.path.basename(doc))
+        
+        sizes: Dict[str, int] = {}
+        for dirpath, names in by_dir.items():
+            try:
+                with os.scandir(dirpath) as it:
+                    for entry in it:
+                        if entry.name in names and entry.is_file():
+                            sizes[os.path.join(dirpath, entry.name)] = entry.stat().st_size
+            except FileNotFoundError:
+                continue
+        
+        for doc in docs:
+            size = sizes.get(os.path.join(os.path.dirname(doc) or ".", os.path.basename(doc)))
+            if size is not None:
                 # Check it's not empty
-                if path.stat().st_size > 100:
-                    print(f"  ✅ {doc}")
-                    self.results["passed"] += 1
+                if size > 100:
+                    self._record(PASSED, f"  ✅ {doc}")
                 else:
-                    print(f"  ⚠️  {doc}: Too small")
-                    self.results["skipped"] += 1
+                    self._record(SKIPPED, f"  ⚠️  {doc}: Too small")
             else:
-                print(f"  ❌ {doc}: Not found")
-                self.results["failed"] += 1
+                self._record(FAILED, f"  ❌ {doc}: Not found")
     
     def test_config_files(self):
         """Test that configuration files are valid."""
@@ -253,39 +347,38 @@ class FrameworkTester:
             ("config/sota_config.yaml", self._validate_yaml),
         ]
         
-        print(f"\nTesting {len(configs)} config files...\n")
+        self._emit(f"\nTesting {len(configs)} config files...\n")
         
         for config_path, validator in configs:
             path = Path(config_path)
             if path.exists():
                 try:
                     validator(path)
-                    print(f"  ✅ {config_path}")
-                    self.results["passed"] += 1
+                    self._record(PASSED, f"  ✅ {config_path}")
                 except Exception as e:
-                    print(f"  ❌ {config_path}: {e}")
-                    self.results["failed"] += 1
+                    self._record(FAILED, f"  ❌ {config_path}: {e}")
             else:
-                print(f"  ⚠️  {config_path}: Not found")
-                self.results["skipped"] += 1
+                self._record(SKIPPED, f"  ⚠️  {config_path}: Not found")
     
     def _validate_toml(self, path: Path):
         """Validate TOML file."""
         try:
-            import tomli
-            with open(path, 'rb') as f:
-                tomli.load(f)
+            import tomllib  # Python 3.11+
         except ImportError:
-            # Try with toml
-            import toml
-            with open(path, 'r') as f:
-                toml.load(f)
+            import tomli as tomllib
+        with open(path, 'rb') as f:
+            tomllib.load(f)
     
     def _validate_yaml(self, path: Path):
         """Validate YAML file."""
         import yaml
-        with open(path, 'r') as f:
-            yaml.safe_load(f)
+        try:
+            from yaml import CSafeLoader as _Loader  # libyaml-backed
+        except ImportError:
+            from yaml import SafeLoader as _Loader
+        # libyaml parses bytes directly, skipping Python's text decoding layer
+        with open(path, 'rb') as f:
+            yaml.load(f, Loader=_Loader)
     
     def print_summary(self):
         """Print test summary."""
@@ -293,22 +386,193 @@ class FrameworkTester:
         print("📊 Test Summary")
         print("="*80)
         
-        total = self.results["passed"] + self.results["failed"] + self.results["skipped"]
+        passed, failed, skipped = self.counts
+        total = passed + failed + skipped
+        
+        # Scale once; max() also keeps an empty run from dividing by zero
+        inv = 100.0 / max(total, 1)
         
         print(f"\nTotal Tests: {total}")
-        print(f"✅ Passed:   {self.results['passed']} ({self.results['passed']/total*100:.1f}%)")
-        print(f"❌ Failed:   {self.results['failed']} ({self.results['failed']/total*100:.1f}%)")
-        print(f"⚠️  Skipped:  {self.results['skipped']} ({self.results['skipped']/total*100:.1f}%)")
+        print(f"✅ Passed:   {passed} ({passed * inv:.1f}%)")
+        print(f"❌ Failed:   {failed} ({failed * inv:.1f}%)")
+        print(f"⚠️  Skipped:  {skipped} ({skipped * inv:.1f}%)")
         print()
         
-        if self.results["failed"] == 0:
+        if self.verbose:
+            # Recap the non-passing checks so they needn't be found in the scrollback
+            for status, line in self.details:
+                if status != PASSED:
+                    print(line.strip())
+            print()
+        
+        if failed == 0:
             print("🎉 All critical tests passed!")
             return 0
         else:
-            print(f"⚠️  {self.results['failed']} test(s) failed")
+            print(f"⚠️  {failed} test(s) failed")
             return 1
 
 
+def _test_module(name: str) -> int:
+    """Import a single module and report the outcome."""
+    print(f"Testing module: {name}")
+    try:
+        importlib.import_module(name)
+        print(f"✅ {name} imported successfully")
+        return 0
+    except Exception as e:
+        print(f"❌ {name} failed: {e}")
+        return 1
+
+
+def _is_private_dir(path: str) -> bool:
+    """True if only this user (or the sticky bit) controls which entries exist in path."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    if st.st_mode & stat.S_ISVTX:
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+
+def _is_trusted_socket(socket_path: str) -> bool:
+    """True if socket_path is a socket owned by this user in a directory others can't swap it in."""
+    try:
+        st = os.lstat(socket_path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISSOCK(st.st_mode)
+        and st.st_uid == os.getuid()
+        and _is_private_dir(os.path.dirname(os.path.abspath(socket_path)))
+    )
+
+
+def _evict_project_modules():
+    """Forget the framework's own modules so the next import reads the current tree."""
+    global _ADVISOR
+    prefix = _ROOT + os.sep
+    this_module = sys.modules[__name__]
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None) or ""
+        if path.startswith(prefix) and "site-packages" not in path and module is not this_module:
+            del sys.modules[name]
+    importlib.invalidate_caches()
+    _find_spec.cache_clear()
+    # These hold objects built from the evicted modules
+    _ADAPTERS.clear()
+    _ADVISOR = None
+
+
+class _TesterRequestHandler(socketserver.StreamRequestHandler):
+    """Handle one JSON-line request against the server's long-lived tester."""
+    
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            # A bare connect, e.g. another --serve checking the socket is live
+            return
+        try:
+            request = json.loads(line)
+            response = self.server.dispatch(request)
+        except Exception as e:
+            response = {"returncode": 1, "output": f"❌ Bad request: {e}\n"}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class TesterServer(socketserver.UnixStreamServer):
+    """
+    Unix-socket server that keeps one FrameworkTester (and its imports) warm.
+    
+    Requests are single JSON lines such as {"cmd": "module", "name": "memory"},
+    {"cmd": "run_all", "quick": true} or {"cmd": "test_imports"}; replies are
+    {"returncode": int, "output": str}. Interpreter startup and third-party
+    imports are paid once; the framework's own modules are re-imported for
+    every request, so results always reflect the current source tree.
+    """
+    
+    def __init__(self, socket_path: str = DEFAULT_SOCKET):
+        socket_dir = os.path.dirname(os.path.abspath(socket_path))
+        os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+        if not _is_private_dir(socket_dir):
+            raise PermissionError(f"{socket_dir} is writable by other users")
+        self._remove_stale_socket(socket_path)
+        super().__init__(socket_path, _TesterRequestHandler)
+        os.chmod(socket_path, 0o600)
+        self.socket_path = socket_path
+        self.tester = FrameworkTester()
+    
+    @staticmethod
+    def _remove_stale_socket(socket_path: str):
+        """Unlink a socket left behind by a dead server; refuse to touch anything else."""
+        try:
+            st = os.lstat(socket_path)
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(st.st_mode):
+            raise FileExistsError(f"{socket_path} exists and is not a socket")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            probe.settimeout(1.0)
+            try:
+                probe.connect(socket_path)
+            except OSError:
+                os.unlink(socket_path)
+                return
+        raise FileExistsError("another tester is already listening there")
+    
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one request, capturing everything it prints."""
+        cmd = request.get("cmd", "")
+        # Each request reports only its own counts, against freshly imported code
+        self.tester.reset()
+        self.tester._arch_cache.clear()
+        _evict_project_modules()
+        
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            if cmd == "module":
+                returncode = _test_module(request["name"])
+            elif cmd == "run_all":
+                self.tester.run_all_tests(quick=bool(request.get("quick")))
+                returncode = int(self.tester.counts[FAILED] > 0)
+            elif cmd.startswith("test_") and callable(getattr(self.tester, cmd, None)):
+                try:
+                    getattr(self.tester, cmd)()
+                finally:
+                    self.tester._flush()
+                returncode = int(self.tester.counts[FAILED] > 0)
+            else:
+                print(f"❌ Unknown command: {cmd!r}")
+                returncode = 1
+        return {"returncode": returncode, "output": buf.getvalue()}
+    
+    def server_close(self):
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.socket_path)
+
+
+def _send_request(request: Dict[str, Any], socket_path: str = DEFAULT_SOCKET) -> Optional[Dict[str, Any]]:
+    """
+    Send a request to a running `--serve` process.
+    
+    Returns None (so the caller runs the test itself) if no server owned by
+    this user is listening or it doesn't answer within _REQUEST_TIMEOUT.
+    """
+    if not hasattr(socket, "AF_UNIX") or not _is_trusted_socket(socket_path):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_REQUEST_TIMEOUT)
+            sock.connect(socket_path)
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reply:
+                return json.loads(reply.readline())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
 def main():
     """Main entry point."""
     import argparse
@@ -326,25 +590,52 @@ def main():
         type=str,
         help="Test specific module only"
     )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Keep per-check details and recap failures and skips in the summary"
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep a warm tester running on a Unix socket for repeated --module runs"
+    )
+    parser.add_argument(
+        "--socket",
+        default=DEFAULT_SOCKET,
+        help=f"Unix socket path for --serve/--module (default: {DEFAULT_SOCKET})"
+    )
     
     args = parser.parse_args()
     
-    tester = FrameworkTester()
-    
-    if args.module:
-        print(f"Testing module: {args.module}")
-        # Module-specific testing
+    if args.serve:
+        if not hasattr(socket, "AF_UNIX"):
+            print("❌ --serve requires Unix domain socket support")
+            return 1
         try:
-            importlib.import_module(args.module)
-            print(f"✅ {args.module} imported successfully")
-            return 0
-        except Exception as e:
-            print(f"❌ {args.module} failed: {e}")
+            server = TesterServer(args.socket)
+        except OSError as e:
+            print(f"❌ Cannot serve on {args.socket}: {e}")
             return 1
-    else:
-        return tester.run_all_tests(quick=args.quick)
+        with server:
+            print(f"🧪 Serving framework tests on {args.socket} (Ctrl+C to stop)")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+        return 0
+    
+    if args.module:
+        # Module-specific testing, delegated to a warm server when one is running
+        response = _send_request({"cmd": "module", "name": args.module}, args.socket)
+        if response is not None:
+            sys.stdout.write(response["output"])
+            return response["returncode"]
+        return _test_module(args.module)
+    
+    tester = FrameworkTester(verbose=args.verbose)
+    return tester.run_all_tests(quick=args.quick)
 
 
 if __name__ == "__main__":
     sys.exit(main())
-
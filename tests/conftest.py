@@ -5,27 +5,37 @@ Shared pytest fixtures for all tests.
 """
 
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
-from typing import Dict, Any
+import pytest_asyncio
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
 
-@pytest.fixture
-def sample_input_data() -> Dict[str, Any]:
+def _frozen(value):
+    """Recursively wrap dicts in read-only proxies and lists in tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _frozen(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_frozen(v) for v in value)
+    return value
+
+
+# Pure-data fixtures are built once per session and shared read-only;
+# copy with dict()/list() in a test that needs to modify them.
+@pytest.fixture(scope="session")
+def sample_input_data() -> Mapping[str, Any]:
     """Sample input data for testing."""
-    return {
+    return _frozen({
         "transaction_id": "test_123",
         "amount": 1000.00,
         "merchant": "Test Merchant",
         "timestamp": "2025-06-30T10:00:00Z"
-    }
+    })
 
 
-@pytest.fixture
-def sample_agent_config() -> Dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_agent_config() -> Mapping[str, Any]:
     """Sample agent configuration."""
-    return {
+    return _frozen({
         "name": "test_agent",
         "type": "critical_path",
         "execution_mode": "in_process",
@@ -34,43 +44,43 @@ def sample_agent_config() -> Dict[str, Any]:
             "max_retries": 3,
             "backoff_multiplier": 2
         }
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_training_data():
     """Sample training data for optimization."""
-    return [
+    return _frozen([
         {"input": "Transaction $100", "output": "legitimate"},
         {"input": "Wire transfer $10000", "output": "review"},
         {"input": "Multiple rapid transactions", "output": "fraud"},
         {"input": "Regular grocery purchase", "output": "legitimate"},
-    ]
+    ])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_evaluation_data():
     """Sample evaluation data."""
-    return [
+    return _frozen([
         {"input": "Test case 1", "expected": "result 1"},
         {"input": "Test case 2", "expected": "result 2"},
-    ]
+    ])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_llm_response():
     """Mock LLM response."""
-    return {
+    return _frozen({
         "result": "Test response",
         "confidence": 0.95,
         "reasoning": "This is a test"
-    }
+    })
 
 
 # Async fixtures
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_agent():
-    """Async agent fixture."""
+    """Async agent fixture, built once on the session-wide event loop."""
     from agents.base import Agent
     from shared.schemas import AgentInput, AgentOutput
     
@@ -96,11 +106,9 @@ def setup_test_environment():
 
 # Temporary directory fixtures
 @pytest.fixture
-def temp_dir():
-    """Create a temporary directory for tests."""
-    temp_path = tempfile.mkdtemp()
-    yield Path(temp_path)
-    shutil.rmtree(temp_path, ignore_errors=True)
+def temp_dir(tmp_path):
+    """Temporary directory for tests (pytest's tmp_path, cleaned up by pytest)."""
+    return tmp_path
 
 
 @pytest.fixture
@@ -148,6 +156,35 @@ def mock_agent_router():
     return AgentRouter()
 
 
+# Monitoring and optimization fixtures; built once and only read by tests
+@pytest.fixture(scope="session")
+def health_check():
+    """Shared HealthCheck with the default checks registered."""
+    from monitoring import HealthCheck
+    return HealthCheck()
+
+
+@pytest.fixture(scope="session")
+def prompt_optimizer():
+    """Shared PromptOptimizer."""
+    from optimization import PromptOptimizer
+    return PromptOptimizer()
+
+
+@pytest.fixture(scope="session")
+def dspy_optimizer():
+    """Shared DSPyOptimizer."""
+    from optimization import DSPyOptimizer
+    return DSPyOptimizer()
+
+
+@pytest.fixture(scope="session")
+def textgrad_optimizer():
+    """Shared TextGradOptimizer."""
+    from optimization import TextGradOptimizer
+    return TextGradOptimizer()
+
+
 @pytest.fixture
 def sample_architect_brief():
     """Sample architecture brief."""
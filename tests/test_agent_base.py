@@ -5,8 +5,19 @@ Basic smoke tests to ensure core functionality works.
 """
 
 import pytest
-from agents.base import Agent, CriticalPathAgent, EnrichmentAgent
-from shared.schemas import AgentInput, AgentOutput
+from functools import lru_cache
+
+
+def _agents():
+    """Import agent base classes lazily so collection doesn't load the agent stack."""
+    import agents.base as m
+    return m
+
+
+def _schemas():
+    """Import shared schemas lazily."""
+    import shared.schemas as m
+    return m
 
 
 class TestAgentImports:
@@ -14,33 +25,47 @@ class TestAgentImports:
     
     def test_agent_classes_importable(self):
         """Ensure agent base classes can be imported."""
+        from agents.base import Agent, CriticalPathAgent, EnrichmentAgent
         assert Agent is not None
         assert CriticalPathAgent is not None
         assert EnrichmentAgent is not None
 
 
-class SimpleCriticalPathAgent(CriticalPathAgent):
-    """Test implementation of critical path agent."""
-    
-    def execute(self, input_data: AgentInput) -> AgentOutput:
-        """Return dummy result."""
+_AGENT_TEMPLATE = """
+class {name}(base):
+    \"\"\"Generated test agent.\"\"\"
+
+    def execute(self, input_data):
+        \"\"\"Return a fixed result.\"\"\"
         return AgentOutput(
-            agent_name="test_critical",
-            result={"score": 0.5},
-            confidence=0.95
+            agent_name={agent_name!r},
+            result=dict({result!r}),
+            confidence={confidence!r}
         )
+"""
 
 
-class SimpleEnrichmentAgent(EnrichmentAgent):
-    """Test implementation of enrichment agent."""
+@lru_cache(maxsize=None)
+def _make_agent(base_name: str, name: str, agent_name: str, result: tuple, confidence: float):
+    """
+    Stamp out a concrete agent subclass whose execute() returns a fixed output.
     
-    def execute(self, input_data: AgentInput) -> AgentOutput:
-        """Return dummy enrichment."""
-        return AgentOutput(
-            agent_name="test_enrichment",
-            result={"enriched": True},
-            confidence=0.8
-        )
+    Cached on its arguments, so every test asking for the same shape gets the
+    identical class object (and pydantic's per-class caches stay warm).
+    """
+    namespace = {"base": getattr(_agents(), base_name), "AgentOutput": _schemas().AgentOutput}
+    exec(_AGENT_TEMPLATE.format(name=name, agent_name=agent_name, result=result, confidence=confidence), namespace)
+    return namespace[name]
+
+
+def _simple_critical_path_agent():
+    """Critical path test agent class."""
+    return _make_agent("CriticalPathAgent", "SimpleCriticalPathAgent", "test_critical", (("score", 0.5),), 0.95)
+
+
+def _simple_enrichment_agent():
+    """Enrichment test agent class."""
+    return _make_agent("EnrichmentAgent", "SimpleEnrichmentAgent", "test_enrichment", (("enriched", True),), 0.8)
 
 
 class TestCriticalPathAgent:
@@ -48,12 +73,14 @@ class TestCriticalPathAgent:
     
     def test_critical_path_agent_creation(self):
         """Test critical path agent can be created."""
-        agent = SimpleCriticalPathAgent()
+        agent = _simple_critical_path_agent()()
         assert agent is not None
     
     def test_critical_path_agent_execute(self):
         """Test critical path agent execution."""
-        agent = SimpleCriticalPathAgent()
+        from shared.schemas import AgentInput, AgentOutput
+        
+        agent = _simple_critical_path_agent()()
         
         # Create dummy request
         request = AgentInput(
@@ -75,12 +102,14 @@ class TestEnrichmentAgent:
     
     def test_enrichment_agent_creation(self):
         """Test enrichment agent can be created."""
-        agent = SimpleEnrichmentAgent()
+        agent = _simple_enrichment_agent()()
         assert agent is not None
     
     def test_enrichment_agent_execute(self):
         """Test enrichment agent execution."""
-        agent = SimpleEnrichmentAgent()
+        from shared.schemas import AgentInput, AgentOutput
+        
+        agent = _simple_enrichment_agent()()
         
         # Create dummy request
         request = AgentInput(
@@ -95,4 +124,3 @@ class TestEnrichmentAgent:
         assert isinstance(result, AgentOutput)
         assert result.agent_name == "test_enrichment"
         assert result.result["enriched"] is True
-
@@ -5,29 +5,38 @@ Tests for core agent functionality.
 """
 
 import pytest
-from agents.base import Agent, CriticalPathAgent, EnrichmentAgent
-from shared.schemas import AgentInput, AgentOutput
+from functools import lru_cache
 
 
-class TestAgent(Agent):
-    """Test agent implementation."""
+@lru_cache(maxsize=None)
+def _test_agent():
+    """Build the test agent class on first use so collection doesn't load the agent stack."""
+    from agents.base import Agent
+    from shared.schemas import AgentInput, AgentOutput
     
-    async def execute(self, input_data: AgentInput) -> AgentOutput:
-        """Test execution."""
-        return AgentOutput(
-            agent_name="test_agent",
-            result={"status": "success"},
-            confidence=0.95
-        )
+    class TestAgent(Agent):
+        """Test agent implementation."""
+        
+        async def execute(self, input_data: AgentInput) -> AgentOutput:
+            """Test execution."""
+            return AgentOutput(
+                agent_name="test_agent",
+                result={"status": "success"},
+                confidence=0.95
+            )
+    
+    return TestAgent
 
 
 class TestAgentBase:
     """Test base agent functionality."""
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_agent_execute(self):
         """Test basic agent execution."""
-        agent = TestAgent()
+        from shared.schemas import AgentInput
+        
+        agent = _test_agent()()
         
         input_data = AgentInput(
             transaction_id="test_123",
@@ -42,16 +51,18 @@ class TestAgentBase:
     
     def test_agent_initialization(self):
         """Test agent initialization."""
-        agent = TestAgent()
+        agent = _test_agent()()
         assert agent is not None
 
 
 class TestCriticalPathAgent:
     """Test critical path agent."""
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_critical_path_execution(self):
         """Test critical path execution."""
+        from agents.base import CriticalPathAgent
+        from shared.schemas import AgentInput, AgentOutput
         
         class TestCriticalAgent(CriticalPathAgent):
             async def execute(self, input_data: AgentInput) -> AgentOutput:
@@ -71,9 +82,11 @@ class TestCriticalPathAgent:
 class TestEnrichmentAgent:
     """Test enrichment agent."""
     
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_enrichment_execution(self):
         """Test enrichment execution."""
+        from agents.base import EnrichmentAgent
+        from shared.schemas import AgentInput, AgentOutput
         
         class TestEnrichmentAgent(EnrichmentAgent):
             async def execute(self, input_data: AgentInput) -> AgentOutput:
@@ -105,7 +118,7 @@ class TestAgentRegistry:
         from agents.registry import AgentRegistry
         
         registry = AgentRegistry()
-        agent = TestAgent()
+        agent = _test_agent()()
         
         registry.register("test_agent", agent)
         assert "test_agent" in registry.list_agents()
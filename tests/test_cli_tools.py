@@ -1,139 +1,177 @@
 """
 Comprehensive tests for CLI tools.
+
+The CLIs are argparse-based, so most tests call each module's ``main()`` in
+this process with ``sys.argv`` patched and stdout captured. Only
+``test_cli_end_to_end`` starts real interpreters, and it runs them concurrently.
 """
+import asyncio
+import contextlib
+import io
+import re
 import pytest
-import subprocess
 import sys
-import tempfile
-from pathlib import Path
+from unittest import mock
+
+from sota_agent import architect, cli, learn, setup_wizard
+
+
+# The CLI tests patch process-wide sys.argv/stdout, so keep them on one xdist worker
+pytestmark = [pytest.mark.cli, pytest.mark.xdist_group("cli")]
+
+
+def _run_main(main, argv, stdin=""):
+    """Run a CLI ``main()`` in-process; return (exit code, captured stdout)."""
+    out = io.StringIO()
+    code = 0
+    with mock.patch.object(sys, "argv", argv), \
+            mock.patch.object(sys, "stdin", io.StringIO(stdin)), \
+            contextlib.redirect_stdout(out):
+        try:
+            main()
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else int(e.code is not None)
+    return code, out.getvalue()
+
+
+async def _run_module(*args, timeout=30):
+    """Run `python -m <args>` as a subprocess; return (exit code, stdout, stderr)."""
+    proc = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    return proc.returncode, stdout.decode(), stderr.decode()
+
+
+# First reported level in architect output: `"level": 3` (JSON) or `Level 3` (text)
+_LEVEL_RE = re.compile(r'level["\s:]+(\d+)', re.IGNORECASE)
+
+
+ARCHITECT_LEVEL_CASES = [
+    ("Simple FAQ bot", 1),
+    ("Chatbot with persistent memory, session tracking, and conversation history storage", 2),
+    ("Production API with 99.9% uptime, monitoring, rate limiting, and authentication", 3),
+    ("Agent that creates plans, executes them, critiques results, and replans based on feedback", 4),
+    ("Multiple autonomous agents that communicate using A2A protocol and coordinate tasks", 5),
+]
+
+
+@pytest.fixture(scope="session")
+def advisor_cli():
+    """In-process `agent-architect` runner: advisor_cli(*args) -> (exit code, stdout)."""
+    def run(*args):
+        return _run_main(architect.main, ["agent-architect", *args])
+
+    return run
 
 
 class TestCLITools:
     """Test all CLI commands."""
-    
-    def test_architect_help(self):
+
+    def test_architect_help(self, advisor_cli):
         """Test agent-architect --help."""
-        result = subprocess.run(
-            [sys.executable, "-m", "sota_agent.architect", "--help"],
-            capture_output=True,
-            text=True
-        )
-        assert "usage" in result.stdout.lower() or "brief" in result.stdout.lower()
-    
-    def test_architect_basic_brief(self):
+        _, stdout = advisor_cli("--help")
+        out = stdout.lower()
+        assert "usage" in out or "brief" in out
+
+    def test_architect_basic_brief(self, advisor_cli):
         """Test agent-architect with a simple brief."""
-        result = subprocess.run(
-            [sys.executable, "-m", "sota_agent.architect", "Build a simple chatbot", "--json"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        assert result.returncode == 0
-        assert "level" in result.stdout.lower()
-    
-    def test_architect_all_levels(self):
-        """Test architect recommendations for all levels."""
-        test_cases = [
-            ("Simple FAQ bot", 1),
-            ("Chatbot with persistent memory, session tracking, and conversation history storage", 2),
-            ("Production API with 99.9% uptime, monitoring, rate limiting, and authentication", 3),
-            ("Agent that creates plans, executes them, critiques results, and replans based on feedback", 4),
-            ("Multiple autonomous agents that communicate using A2A protocol and coordinate tasks", 5),
-        ]
-        
-        for brief, expected_level in test_cases:
-            result = subprocess.run(
-                [sys.executable, "-m", "sota_agent.architect", brief, "--json"],
-                capture_output=True,
-                text=True,
-                timeout=10
+        code, stdout = advisor_cli("Build a simple chatbot", "--json")
+        assert code == 0
+        assert "level" in stdout.lower()
+
+    @pytest.mark.slow
+    @pytest.mark.timeout(60)
+    @pytest.mark.asyncio
+    async def test_cli_end_to_end(self, tmp_path):
+        """Smoke test the real `python -m` entry points, launched concurrently."""
+        domains = ["test_domain", "support_domain"]
+        (code, stdout, stderr), *generated = await asyncio.gather(
+            _run_module("sota_agent.architect", "Build a simple chatbot", "--json"),
+            *(
+                _run_module("sota_agent.cli", "--domain", domain, "--output", str(tmp_path / domain))
+                for domain in domains
             )
-            assert result.returncode == 0
-            # Check level is present (allow some tolerance for edge cases)
-            output_lower = result.stdout.lower()
-            has_level = f"level {expected_level}" in output_lower or f"level\": {expected_level}" in output_lower
-            # For edge cases, check if it's within ±1 level
-            if not has_level and expected_level > 1:
-                has_nearby = (f"level {expected_level-1}" in output_lower or 
-                             f"level {expected_level+1}" in output_lower or
-                             f"level\": {expected_level-1}" in output_lower or
-                             f"level\": {expected_level+1}" in output_lower)
-                assert has_nearby, f"Expected level {expected_level} or nearby, got: {result.stdout[:200]}"
-            else:
-                assert has_level, f"Expected level {expected_level}, got: {result.stdout[:200]}"
-    
+        )
+
+        assert code == 0, f"agent-architect failed: {stderr}"
+        assert "level" in stdout.lower()
+
+        for domain, (code, _, stderr) in zip(domains, generated):
+            assert code == 0, f"agent-generate {domain} failed: {stderr}"
+            assert any((tmp_path / domain).iterdir()), f"No files generated for {domain}"
+
+    @pytest.mark.parametrize("brief,expected_level", ARCHITECT_LEVEL_CASES)
+    def test_architect_level(self, advisor_cli, brief, expected_level):
+        """Test architect recommendations for each level."""
+        code, stdout = advisor_cli(brief, "--json")
+        assert code == 0
+        match = _LEVEL_RE.search(stdout)
+        assert match, f"No level in output: {stdout[:200]}"
+        # Allow ±1 for edge cases above Level 1
+        tolerance = 1 if expected_level > 1 else 0
+        assert abs(int(match.group(1)) - expected_level) <= tolerance, \
+            f"Expected level {expected_level}, got: {stdout[:200]}"
+
     def test_learn_help(self):
         """Test agent-learn --help."""
-        result = subprocess.run(
-            [sys.executable, "-m", "sota_agent.learn", "--help"],
-            capture_output=True,
-            text=True
-        )
-        assert "usage" in result.stdout.lower() or "learn" in result.stdout.lower()
-    
+        _, stdout = _run_main(learn.main, ["agent-learn", "--help"])
+        out = stdout.lower()
+        assert "usage" in out or "learn" in out
+
     def test_learn_info(self):
         """Test agent-learn info command."""
         # Test info command with level 1
-        result = subprocess.run(
-            [sys.executable, "-m", "sota_agent.learn", "info", "1"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        assert result.returncode == 0
-        assert "level" in result.stdout.lower()
-        assert "chatbot" in result.stdout.lower() or "simple" in result.stdout.lower()
-    
+        code, stdout = _run_main(learn.main, ["agent-learn", "info", "1"])
+        assert code == 0
+        out = stdout.lower()
+        assert "level" in out
+        assert "chatbot" in out or "simple" in out
+
     def test_generate_help(self):
         """Test agent-generate --help."""
-        result = subprocess.run(
-            [sys.executable, "-m", "sota_agent.cli", "--help"],
-            capture_output=True,
-            text=True
-        )
-        assert "usage" in result.stdout.lower()
-        assert "domain" in result.stdout.lower()
-    
-    def test_generate_project(self):
+        _, stdout = _run_main(cli.main, ["agent-generate", "--help"])
+        out = stdout.lower()
+        assert "usage" in out
+        assert "domain" in out
+
+    def test_generate_project(self, tmp_path):
         """Test agent-generate creates a project."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test_agent"
-            result = subprocess.run(
-                [
-                    sys.executable, "-m", "sota_agent.cli",
-                    "--domain", "test_domain",
-                    "--output", str(output_path)
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            
-            # Check command succeeded
-            assert result.returncode == 0, f"Command failed: {result.stderr}"
-            
-            # Check output directory exists
-            assert output_path.exists(), f"Output path not created: {output_path}"
-            
-            # Check key files are created (may vary by implementation)
-            files_created = list(output_path.rglob("*"))
-            assert len(files_created) > 0, "No files were created"
-            
-            # Try to find key files (they might be in subdirectories)
-            has_pyproject = any("pyproject.toml" in str(f) for f in files_created)
-            has_readme = any("README.md" in str(f) for f in files_created)
-            
-            # At minimum, check that SOME files were created
-            assert has_pyproject or has_readme or len(files_created) > 5, \
-                f"Expected project files not found. Created: {[f.name for f in files_created[:10]]}"
-    
+        output_path = tmp_path / "test_agent"
+        code, _ = _run_main(cli.main, [
+            "agent-generate",
+            "--domain", "test_domain",
+            "--output", str(output_path)
+        ])
+
+        # Check command succeeded
+        assert code == 0, "Command failed"
+
+        # Check output directory exists
+        assert output_path.exists(), f"Output path not created: {output_path}"
+
+        # Check key files are created (may vary by implementation)
+        files_created = list(output_path.rglob("*"))
+        assert len(files_created) > 0, "No files were created"
+
+        # Try to find key files (they might be in subdirectories)
+        has_pyproject = any("pyproject.toml" in str(f) for f in files_created)
+        has_readme = any("README.md" in str(f) for f in files_created)
+
+        # At minimum, check that SOME files were created
+        assert has_pyproject or has_readme or len(files_created) > 5, \
+            f"Expected project files not found. Created: {[f.name for f in files_created[:10]]}"
+
     def test_setup_wizard(self):
         """Test agent-setup runs without error."""
-        result = subprocess.run(
-            [sys.executable, "-m", "sota_agent.setup_wizard"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        assert "setup" in result.stdout.lower() or "wizard" in result.stdout.lower()
-
+        # A StringIO stdin is not a TTY, so the wizard takes its non-interactive path
+        _, stdout = _run_main(setup_wizard.main, ["agent-setup"])
+        out = stdout.lower()
+        assert "setup" in out or "wizard" in out
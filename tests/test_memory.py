@@ -5,18 +5,29 @@ Tests for agent-governed memory.
 """
 
 import pytest
+import pytest_asyncio
 from memory import MemoryManager, MemoryType, MemoryImportance
+from memory.stores import ShortTermMemory, LongTermMemory
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def memory_manager():
+    """One MemoryManager for the module, seeded once; tests add to it but never reset it."""
+    manager = MemoryManager()
+    await manager.store(
+        content="Test memory",
+        memory_type=MemoryType.SHORT_TERM
+    )
+    yield manager
 
 
 class TestMemoryManager:
     """Test memory manager."""
     
-    @pytest.mark.asyncio
-    async def test_memory_storage(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_memory_storage(self, memory_manager):
         """Test storing memories."""
-        manager = MemoryManager()
-        
-        await manager.store(
+        await memory_manager.store(
             content="Important transaction detected",
             memory_type=MemoryType.EPISODIC,
             importance=MemoryImportance.HIGH,
@@ -25,19 +36,11 @@ class TestMemoryManager:
         
         assert True  # Memory stored successfully
     
-    @pytest.mark.asyncio
-    async def test_memory_retrieval(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_memory_retrieval(self, memory_manager):
         """Test retrieving memories."""
-        manager = MemoryManager()
-        
-        # Store memory
-        await manager.store(
-            content="Test memory",
-            memory_type=MemoryType.SHORT_TERM
-        )
-        
-        # Retrieve
-        results = await manager.retrieve(
+        # "Test memory" was stored by the fixture
+        results = await memory_manager.retrieve(
             query="Test memory",
             top_k=5
         )
@@ -50,15 +53,11 @@ class TestMemoryStores:
     
     def test_short_term_memory(self):
         """Test short-term memory store."""
-        from memory.stores import ShortTermMemory
-        
         store = ShortTermMemory()
         assert store is not None
     
     def test_long_term_memory(self):
         """Test long-term memory store."""
-        from memory.stores import LongTermMemory
-        
         store = LongTermMemory()
         assert store is not None
 
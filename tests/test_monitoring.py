@@ -7,35 +7,37 @@ from monitoring import HealthCheck, HealthStatus
 class TestHealthCheck:
     """Test health check system."""
     
-    def test_health_check_initialization(self):
+    def test_health_check_initialization(self, health_check):
         """Test health check initialization."""
-        health = HealthCheck()
-        assert health is not None
+        assert isinstance(health_check, HealthCheck)
     
-    def test_check_all(self):
+    def test_check_all(self, health_check):
         """Test checking all components."""
-        health = HealthCheck()
-        results = health.check_all()
+        results = health_check.check_all()
         
         assert isinstance(results, dict)
         assert len(results) > 0
     
-    def test_is_healthy(self):
+    def test_is_healthy(self, health_check):
         """Test overall health status."""
-        health = HealthCheck()
-        is_healthy = health.is_healthy()
+        is_healthy = health_check.is_healthy()
         
         assert isinstance(is_healthy, bool)
     
-    def test_status_summary(self):
+    def test_status_summary(self, health_check):
         """Test status summary."""
-        health = HealthCheck()
-        summary = health.get_status_summary()
+        summary = health_check.get_status_summary()
         
         assert "status" in summary
         assert "components" in summary
+    
+    async def test_check_all_async(self, health_check):
+        """Test concurrent checks report the same components as check_all."""
+        results = await health_check.check_all_async()
+        
+        assert results.keys() == health_check.check_all().keys()
+        assert all(isinstance(r.status, HealthStatus) for r in results.values())
 
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
-
@@ -1,18 +1,15 @@
 """Test Suite for Prompt Optimization"""
 
 import pytest
-from optimization import PromptOptimizer
 
 
 class TestPromptOptimizer:
     """Test prompt optimization."""
     
     @pytest.mark.asyncio
-    async def test_system_prompt_optimization(self):
+    async def test_system_prompt_optimization(self, prompt_optimizer):
         """Test system prompt optimization."""
-        optimizer = PromptOptimizer()
-        
-        result = await optimizer.optimize(
+        result = await prompt_optimizer.optimize(
             prompt="You are helpful.",
             prompt_type="system",
             evaluation_data=[
@@ -27,23 +24,17 @@ class TestPromptOptimizer:
 class TestDSPyOptimizer:
     """Test DSPy optimizer."""
     
-    def test_dspy_initialization(self):
+    def test_dspy_initialization(self, dspy_optimizer):
         """Test DSPy optimizer initialization."""
-        from optimization import DSPyOptimizer
-        
-        optimizer = DSPyOptimizer()
-        assert optimizer is not None
+        assert dspy_optimizer is not None
 
 
 class TestTextGradOptimizer:
     """Test TextGrad optimizer."""
     
-    def test_textgrad_initialization(self):
+    def test_textgrad_initialization(self, textgrad_optimizer):
         """Test TextGrad optimizer initialization."""
-        from optimization import TextGradOptimizer
-        
-        optimizer = TextGradOptimizer()
-        assert optimizer is not None
+        assert textgrad_optimizer is not None
 
 
 if __name__ == "__main__":
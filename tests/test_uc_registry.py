@@ -0,0 +1,166 @@
+"""
+Tests for the Unity Catalog registry.
+
+PromptRegistry is exercised against a local directory standing in for the
+Volume (outside Databricks it falls back to plain filesystem access).
+"""
+import gc
+import hashlib
+import shutil
+import weakref
+
+import pytest
+
+from uc_registry import (
+    PromptRegistry, PromptVersion,
+    ModelRegistry, ModelVersion, ModelMetadata,
+    ConfigManager, AgentConfig
+)
+from uc_registry import config_manager, model_registry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """PromptRegistry backed by a fresh temporary directory."""
+    reg = PromptRegistry()
+    reg._base_path = str(tmp_path)
+    return reg
+
+
+@pytest.fixture
+def verify_once(request):
+    """
+    Skip a stub test whose module source hasn't changed since it last passed.
+
+    verify_once(module) skips when the pytest cache (``.pytest_cache``) holds the
+    current digest of module's source; otherwise it returns a callable that
+    records the digest, to be called once the test's assertions have passed.
+    Run with ``--cache-clear`` (as CI should) to force every test; with the
+    cache plugin disabled (``-p no:cacheprovider``) every test always runs.
+    """
+    cache = getattr(request.config, "cache", None)
+
+    def check(module):
+        if cache is None:
+            return lambda: None
+        key = f"uc_registry/verified/{module.__name__}"
+        with open(module.__file__, "rb") as f:
+            digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        if cache.get(key, None) == digest:
+            pytest.skip(f"{module.__name__} unchanged since last verified")
+        return lambda: cache.set(key, digest)
+
+    return check
+
+
+class TestPromptRegistry:
+    """Test prompt registration and lookup."""
+
+    def test_register_and_get_latest(self, registry):
+        """Test registered prompts are versioned and latest follows them."""
+        first = registry.register_prompt("fraud", "v1 text", tags={"env": "test"})
+        second = registry.register_prompt("fraud", "v2 text", system_prompt="Be precise.")
+
+        assert (first.version, second.version) == ("v1", "v2")
+        latest = registry.get_prompt("fraud")
+        assert latest.prompt_text == "v2 text"
+        assert latest.system_prompt == "Be precise."
+        assert registry.get_prompt("fraud", version="v1").metadata.tags == {"env": "test"}
+
+    def test_missing_prompt(self, registry):
+        """Test unknown prompts and versions return None."""
+        assert registry.get_prompt("missing") is None
+        registry.register_prompt("fraud", "text")
+        assert registry.get_prompt("fraud", version="v9") is None
+
+    def test_list_versions(self, registry):
+        """Test list_versions returns versions but not the latest alias."""
+        registry.register_prompt("fraud", "a")
+        registry.register_prompt("fraud", "b", version="custom")
+
+        assert sorted(registry.list_versions("fraud")) == ["custom", "v1"]
+        assert registry.list_versions("missing") == []
+
+    def test_next_version_after_explicit(self, registry):
+        """Test auto-numbering continues past explicitly numbered versions."""
+        registry.register_prompt("fraud", "a")
+        registry.register_prompt("fraud", "b", version="v5")
+        assert registry.register_prompt("fraud", "c").version == "v6"
+
+    def test_reload_after_rewrite(self, registry):
+        """Test a rewritten prompt file is re-read rather than served from cache."""
+        registry.register_prompt("fraud", "old", version="v1")
+        assert registry.get_prompt("fraud", version="v1").prompt_text == "old"
+
+        registry.register_prompt("fraud", "new", version="v1")
+        assert registry.get_prompt("fraud", version="v1").prompt_text == "new"
+
+    def test_recreated_directory(self, registry, tmp_path):
+        """Test prompts are read from a directory recreated after it was cached."""
+        registry.register_prompt("fraud", "old", version="v1")
+        assert registry.get_prompt("fraud", version="v1").prompt_text == "old"
+        
+        shutil.rmtree(tmp_path / "fraud")
+        assert registry.get_prompt("fraud", version="v1") is None
+        registry.register_prompt("fraud", "new", version="v1")
+        assert registry.get_prompt("fraud", version="v1").prompt_text == "new"
+    
+    def test_large_prompt_round_trip(self, registry):
+        """Test prompts large enough to be mmapped on load come back intact."""
+        text = "Ünïcode template line\n" * 2000
+        registry.register_prompt("fraud", text)
+        registry._cache.clear()
+        assert registry.get_prompt("fraud").prompt_text == text
+
+    def test_bulk_register(self, registry):
+        """Test bulk registration fills metadata and repoints latest once per name."""
+        stored = registry.bulk_register([
+            PromptVersion(name="fraud", version="v1", prompt_text="a"),
+            PromptVersion(name="fraud", version="v2", prompt_text="b"),
+            PromptVersion(name="support", version="v1", prompt_text="c"),
+        ])
+
+        assert all(p.metadata is not None for p in stored)
+        assert registry.get_prompt("fraud").prompt_text == "b"
+        assert registry.get_prompt("support").prompt_text == "c"
+
+    def test_released_without_gc(self, tmp_path):
+        """Test a dropped registry is freed without the cycle collector."""
+        reg = PromptRegistry()
+        reg._base_path = str(tmp_path)
+        reg.register_prompt("fraud", "text")
+        reg.get_prompt("fraud")
+        ref = weakref.ref(reg)
+        
+        gc.disable()
+        try:
+            del reg
+            assert ref() is None
+        finally:
+            gc.enable()
+    
+    def test_records_are_frozen(self, registry):
+        """Test returned prompt records can't be modified in place."""
+        prompt = registry.register_prompt("fraud", "text")
+        with pytest.raises(AttributeError):
+            prompt.prompt_text = "changed"
+
+
+class TestStubRegistries:
+    """Test the model registry and config manager stubs."""
+
+    def test_model_registry_init(self, verify_once):
+        """Test ModelRegistry and its records construct."""
+        verified = verify_once(model_registry)
+        registry = ModelRegistry(catalog="test_catalog")
+        assert (registry.catalog, registry.schema) == ("test_catalog", "production")
+        assert ModelVersion(name="m", version="1") == ModelVersion(name="m", version="1")
+        assert ModelMetadata(name="m", version="1").name == "m"
+        verified()
+
+    def test_config_manager_init(self, verify_once):
+        """Test ConfigManager and AgentConfig construct."""
+        verified = verify_once(config_manager)
+        assert ConfigManager().catalog == "sota_agents"
+        assert AgentConfig(name="agent", config={"k": 1}).config == {"k": 1}
+        verified()
@@ -0,0 +1,371 @@
+"""Test Suite for Visualization"""
+
+import contextlib
+import json
+import os
+import re
+import stat
+
+import pytest
+from visualization import DatabricksVisualizer
+from visualization.databricks_viz import _TOOL_CALL_BATCH, _aggregate_actions, _mermaid_svg, _render_mermaid_svg
+
+
+@pytest.fixture
+def viz():
+    """Visualizer outside a notebook."""
+    return DatabricksVisualizer()
+
+
+def _actions(n):
+    """n actions cycling through the action types."""
+    types = ["tool_call", "reasoning", "decision", "other"]
+    return [
+        {"name": f"step_{i}", "type": types[i % 4], "duration_ms": i + 1}
+        for i in range(n)
+    ]
+
+
+def _plot_traces(html):
+    """The trace list passed to Plotly.newPlot."""
+    match = re.search(r"Plotly\.newPlot\('timeline', (\[.*\]), layout\)", html)
+    assert match, html
+    return json.loads(match.group(1))
+
+
+def _plot_layout(html):
+    """The layout passed to Plotly.newPlot."""
+    match = re.search(r"var layout = (\{.*\});", html)
+    assert match, html
+    return json.loads(match.group(1))
+
+
+class TestTimeline:
+    """Test timeline generation."""
+    
+    def test_svg_for_small_traces(self, viz):
+        """Test short traces are drawn as plain SVG without Plotly."""
+        html = viz._generate_timeline_html({"actions": _actions(8)})
+        
+        assert "plotly" not in html.lower()
+        assert html.count("<rect") == 8
+        # The longest bar fills the chart
+        assert "width='720.0'" in html
+    
+    def test_single_trace(self, viz):
+        """Test all actions are drawn as one bar trace coloured by type."""
+        html = viz._generate_timeline_html({"actions": _actions(80)})
+        traces = _plot_traces(html)
+        
+        assert len(traces) == 1
+        bars = traces[0]
+        assert bars["y"] == list(range(80))
+        assert _plot_layout(html)["yaxis"]["ticktext"] == [f"step_{i}" for i in range(80)]
+        assert bars["x"] == list(range(1, 81))
+        assert len(set(bars["marker"]["color"])) == 4
+    
+    @pytest.mark.parametrize("count", [3, 60, 600, 2500])
+    def test_missing_durations(self, viz, count):
+        """Test in-progress actions (duration None) draw as empty bars at every size."""
+        actions = _actions(count)
+        actions[0]["duration_ms"] = None
+        actions[1]["duration_ms"] = "12"
+        
+        html = viz._generate_timeline_html({"actions": actions})
+        assert "None" not in html
+    
+    def test_big_durations(self, viz):
+        """Test durations too large for orjson still serialize."""
+        actions = _actions(60)
+        actions[0]["duration_ms"] = 2 ** 70
+        
+        assert _plot_traces(viz._generate_timeline_html({"actions": actions}))[0]["x"][0] == 2 ** 70
+    
+    @pytest.mark.parametrize("count", [60, 600])
+    def test_repeated_names_get_own_rows(self, viz, count):
+        """Test actions sharing a name (the same tool called again) don't overlap."""
+        actions = [{"name": "search", "duration_ms": i + 1} for i in range(count)]
+        html = viz._generate_timeline_html({"actions": actions})
+        
+        rows = [y for t in _plot_traces(html) for y in t["y"] if y is not None]
+        assert sorted(set(rows)) == list(range(count))
+        assert _plot_layout(html)["yaxis"]["ticktext"] == ["search"] * count
+    
+    def test_webgl_for_large_traces(self, viz):
+        """Test large traces switch to one scattergl trace per action colour."""
+        traces = _plot_traces(viz._generate_timeline_html({"actions": _actions(600)}))
+        
+        assert len(traces) == 4
+        assert {t["type"] for t in traces} == {"scattergl"}
+        # Each bar is a (0, duration, gap) segment
+        assert sum(t["x"].count(None) for t in traces) == 600
+    
+    def test_large_traces_downsampled(self, viz):
+        """Test very long traces are capped but report their original size."""
+        html = viz._generate_timeline_html({"actions": _actions(5000)})
+        
+        assert 'data-original-count="5000"' in html
+        assert sum(t["x"].count(None) for t in _plot_traces(html)) == 2000
+
+
+class TestMermaid:
+    """Test execution graph generation."""
+    
+    def test_graph(self, viz):
+        """Test nodes are shaped by action type and chained Start to End."""
+        src = viz._generate_mermaid({"actions": [
+            {"name": "lookup", "type": "tool_call"},
+            {"name": "weigh", "type": "reasoning"},
+            {"name": "reply"},
+        ]})
+        
+        assert src.splitlines()[:8] == [
+            "graph TD",
+            "    Start([Start]) --> A1",
+            "    A1[lookup]:::tool",
+            "    A1 --> A2",
+            "    A2{weigh}:::reasoning",
+            "    A2 --> A3",
+            "    A3[reply]",
+            "    A3 --> End([End])",
+        ]
+        assert src.count("classDef") == 3
+
+
+class TestAggregateActions:
+    """Test action downsampling."""
+    
+    def test_short_traces_unchanged(self):
+        """Test traces under the cap are returned as-is."""
+        actions = _actions(10)
+        assert _aggregate_actions(actions, max_points=10) is actions
+    
+    def test_keeps_longest_per_bucket(self):
+        """Test each bucket keeps its slowest action, in order."""
+        actions = _actions(10)
+        actions[2]["duration_ms"] = 1000
+        
+        kept = _aggregate_actions(actions, max_points=5)
+        assert [a["name"] for a in kept] == ["step_1", "step_2", "step_5", "step_7", "step_9"]
+
+
+class TestFragmentCache:
+    """Test memoized HTML generation."""
+    
+    def test_same_trace_reuses_html(self, viz):
+        """Test equal traces hit the cache across visualizers and key order."""
+        first = viz._generate_mermaid({"actions": [{"name": "a", "type": "tool_call"}]})
+        second = DatabricksVisualizer()._generate_mermaid({"actions": [{"type": "tool_call", "name": "a"}]})
+        
+        assert second is first
+    
+    def test_changed_trace_rerenders(self, viz):
+        """Test a different trace is rendered afresh."""
+        first = viz._generate_mermaid({"actions": [{"name": "a"}]})
+        second = viz._generate_mermaid({"actions": [{"name": "b"}]})
+        
+        assert "b" in second and second != first
+    
+    def test_key_covers_only_data_read(self, viz):
+        """Test the graph is cached by its actions, not the rest of the trace."""
+        actions = [{"name": "a"}]
+        first = viz._generate_mermaid({"actions": actions, "decisions": [{"name": "x"}]})
+        second = viz._generate_mermaid({"actions": actions, "decisions": [{"name": "y"}]})
+        
+        assert second is first
+    
+    @pytest.mark.parametrize("trace", [
+        {"actions": [{"name": "a", "meta": {(1, 2): 3}}]},
+        {"actions": [{"name": "a", "duration_ms": 2 ** 70}]},
+        {"actions": [{"name": "a"}], "meta": {(1, 2): 3}},
+    ], ids=["tuple-key", "big-int", "tuple-key-outside-actions"])
+    def test_unhashable_trace_rendered(self, viz, trace):
+        """Test traces that can't be digested are still rendered, just uncached."""
+        assert "A1[a]" in viz._generate_mermaid(trace)
+        assert "<rect" in viz._generate_timeline_html(trace)
+
+
+class TestHtmlGenerators:
+    """Test the decision, tool call, prompt and explanation views."""
+    
+    def test_decision_tree(self, viz):
+        """Test every decision is rendered in order."""
+        html = viz._generate_decision_tree_html([
+            {"name": "route", "reason": "high amount"},
+            {"name": "escalate", "reason": "new merchant", "depth": 1},
+        ])
+        
+        assert html.index("route") < html.index("escalate")
+        assert "new merchant" in html
+    
+    def test_explanation(self, viz):
+        """Test factors, context and reasoning all appear."""
+        html = viz._generate_explanation_html(
+            {"action": "block", "factors": [{"name": "risk", "value": 0.9, "weight": 2}], "reasoning": "too risky"},
+            {"amount": 1000}
+        )
+        
+        assert "risk:</strong> 0.9 (weight: 2)" in html
+        assert '"amount": 1000' in html
+        assert "too risky" in html
+    
+    def test_prompt_comparison(self, viz):
+        """Test each version gets a card with its escaped prompt and metrics."""
+        html = viz._generate_prompt_comparison_html([
+            {"version": "v1", "prompt": "Answer <briefly>", "metrics": {"accuracy": 0.9}},
+            {"version": "v2", "prompt": "Answer in detail"},
+        ])
+        
+        assert html.count("class='viz-card'") == 2
+        assert "Answer &lt;briefly&gt;" in html
+        assert "<li>accuracy: 0.9</li>" in html
+
+
+class TestDisplay:
+    """Test standalone output."""
+    
+    def test_dashboard_written_to_file(self, viz, tmp_path, monkeypatch):
+        """Test the streamed dashboard lands in one complete file."""
+        monkeypatch.chdir(tmp_path)
+        viz.ipython, viz.in_databricks = None, False
+        
+        viz.create_dashboard({"actions": _actions(3)})
+        
+        html = (tmp_path / "visualization_output.html").read_text(encoding="utf-8")
+        assert html.strip().startswith("<html>") and html.strip().endswith("</html>")
+        assert all(section in html for section in ('id="graph"', "id='timeline'", 'id="toolcalls"', 'id="decisions"'))
+    
+    def test_dashboard_populated(self, viz, tmp_path, monkeypatch):
+        """Test every dashboard section is filled in, with each script loaded once."""
+        monkeypatch.chdir(tmp_path)
+        viz.ipython, viz.in_databricks = None, False
+        
+        viz.create_dashboard({
+            "actions": _actions(3),
+            "tool_calls": [{"tool": "search"}],
+            "decisions": [{"name": "escalate"}],
+        })
+        
+        html = (tmp_path / "visualization_output.html").read_text(encoding="utf-8")
+        assert "A3 --&gt; End([End])" in html
+        assert html.count("<rect") == 3
+        assert "<span class='tc-name'>search</span>" in html
+        assert "escalate" in html
+        assert html.count("import mermaid") == 1
+
+
+class TestEscaping:
+    """Test trace data can't inject markup."""
+    
+    def test_tool_calls_static(self, viz):
+        """Test a short tool call list is rendered as escaped HTML without scripts."""
+        calls = [{"tool": "<b>search</b>", "input": {"q": "</script>"}, "duration_ms": 5}]
+        html = viz._generate_tool_calls_html(calls)
+        
+        assert "<script" not in html and "<b>" not in html
+        assert "&lt;b&gt;search&lt;/b&gt;" in html and "&lt;/script&gt;" in html
+    
+    def test_tool_calls_data_island(self, viz):
+        """Test calls past the first batch are embedded once as JSON that can't inject markup."""
+        calls = [{"tool": f"t{i}", "duration_ms": i} for i in range(_TOOL_CALL_BATCH)]
+        calls.append({"tool": "<b>search</b>", "input": {"q": "</script>"}, "duration_ms": 5})
+        html = viz._generate_tool_calls_html(calls)
+        
+        assert html.count("<details") == _TOOL_CALL_BATCH + 1  # plus the <template>
+        assert "<b>" not in html and html.count("</script>") == 2
+        island = re.search(r'<script type="application/json">(.*?)</script>', html).group(1)
+        assert json.loads(island) == [{**calls[-1], "output": {}}]
+        # The script finds its view by id, not document.currentScript
+        view_id = re.search(r"<div data-tc='(tc-\w+)'>", html).group(1)
+        assert f'[data-tc="{view_id}"]' in html and "currentScript" not in html
+    
+    def test_timeline_script_not_closed(self, viz):
+        """Test an action name can't end the timeline's script block."""
+        actions = _actions(60)
+        actions[0]["name"] = "</script><i>x"
+        html = viz._generate_timeline_html({"actions": actions})
+        
+        assert html.count("</script>") == 2
+        assert _plot_layout(html)["yaxis"]["ticktext"][0] == "</script><i>x"
+    
+    def test_svg_timeline_escaped(self, viz):
+        """Test action names are escaped in the SVG timeline."""
+        html = viz._generate_timeline_html({"actions": [{"name": "<i>x", "duration_ms": 5}]})
+        
+        assert "<i>" not in html and "&lt;i&gt;x" in html
+
+
+class TestMermaidSvg:
+    """Test server-side Mermaid rendering."""
+    
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start and end each test with an empty render cache."""
+        _mermaid_svg.cache_clear()
+        yield
+        _mermaid_svg.cache_clear()
+    
+    def test_without_mmdc(self, monkeypatch, tmp_path):
+        """Test rendering is skipped when mermaid-cli isn't installed."""
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert _render_mermaid_svg("graph TD") is None
+    
+    @pytest.mark.skipif(os.name == "nt", reason="fake mmdc is a shell script")
+    def test_render_cached(self, monkeypatch, tmp_path):
+        """Test mmdc runs once per distinct source."""
+        log = tmp_path / "calls"
+        mmdc = tmp_path / "mmdc"
+        # Fake mmdc: `mmdc -i IN -o OUT ...` writes an SVG and records the call
+        mmdc.write_text(f'#!/bin/sh\necho run >> "{log}"\necho "<svg></svg>" > "$4"\n')
+        mmdc.chmod(mmdc.stat().st_mode | stat.S_IEXEC)
+        monkeypatch.setenv("PATH", str(tmp_path))
+        
+        assert _render_mermaid_svg("graph TD") == "<svg></svg>\n"
+        assert _render_mermaid_svg("graph TD") == "<svg></svg>\n"
+        assert log.read_text().count("run") == 1
+    
+    @pytest.mark.skipif(os.name == "nt", reason="fake mmdc is a shell script")
+    def test_failure_not_cached(self, monkeypatch, tmp_path):
+        """Test a missing mmdc or failed render is retried on the next call."""
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert _render_mermaid_svg("graph TD") is None
+        
+        mmdc = tmp_path / "mmdc"
+        mmdc.write_text("#!/bin/sh\nexit 1\n")
+        mmdc.chmod(mmdc.stat().st_mode | stat.S_IEXEC)
+        assert _render_mermaid_svg("graph TD") is None
+        
+        mmdc.write_text('#!/bin/sh\necho "<svg></svg>" > "$4"\n')
+        assert _render_mermaid_svg("graph TD") == "<svg></svg>\n"
+
+
+class _FakeMlflow:
+    """Records what log_to_mlflow sends to MLflow."""
+    
+    def __init__(self):
+        self.texts = {}
+        self.metrics = {}
+    
+    @contextlib.contextmanager
+    def start_run(self, run_id=None):
+        yield
+    
+    def log_text(self, text, artifact_file):
+        self.texts[artifact_file] = text
+    
+    def log_metrics(self, metrics):
+        self.metrics.update(metrics)
+
+
+class TestMlflow:
+    """Test MLflow logging."""
+    
+    def test_graph_artifact(self, viz):
+        """Test the graph artifact is escaped and loads Mermaid to render itself."""
+        viz._mlflow = fake = _FakeMlflow()
+        viz.log_to_mlflow({"actions": [{"name": "<img src=x>", "duration_ms": 5}, {"name": "b"}]})
+        
+        graph = fake.texts["visualizations/execution_graph.html"]
+        assert "<img" not in graph and "&lt;img src=x&gt;" in graph
+        assert "import mermaid" in graph
+        assert fake.metrics == {"total_actions": 2, "total_duration_ms": 5}
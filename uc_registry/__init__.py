@@ -21,36 +21,44 @@ Usage:
     prompt = registry.get_prompt("fraud_detector", version="latest")
 """
 
-from .prompt_registry import (
-    PromptRegistry,
-    PromptVersion,
-    PromptMetadata
-)
-
-from .model_registry import (
-    ModelRegistry,
-    ModelVersion,
-    ModelMetadata
-)
-
-from .config_manager import (
-    ConfigManager,
-    AgentConfig
-)
-
-__all__ = [
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> defining submodule. Submodules are imported on first attribute
+# access (PEP 562), so e.g. ModelRegistry users never load prompt_registry.
+_LAZY_IMPORTS = {
     # Prompt Registry
-    "PromptRegistry",
-    "PromptVersion",
-    "PromptMetadata",
+    "PromptRegistry": ".prompt_registry",
+    "PromptVersion": ".prompt_registry",
+    "PromptMetadata": ".prompt_registry",
     
     # Model Registry
-    "ModelRegistry",
-    "ModelVersion",
-    "ModelMetadata",
+    "ModelRegistry": ".model_registry",
+    "ModelVersion": ".model_registry",
+    "ModelMetadata": ".model_registry",
     
     # Config Manager
-    "ConfigManager",
-    "AgentConfig",
-]
+    "ConfigManager": ".config_manager",
+    "AgentConfig": ".config_manager",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    from .prompt_registry import PromptRegistry, PromptVersion, PromptMetadata
+    from .model_registry import ModelRegistry, ModelVersion, ModelMetadata
+    from .config_manager import ConfigManager, AgentConfig
+
+
+def __getattr__(name: str):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
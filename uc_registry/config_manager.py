@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(frozen=True)
 class AgentConfig:
     """Agent configuration."""
     name: str
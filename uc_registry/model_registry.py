@@ -3,13 +3,13 @@
 from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(frozen=True)
 class ModelMetadata:
     """Model metadata."""
     name: str
     version: str
 
-@dataclass
+@dataclass(frozen=True)
 class ModelVersion:
     """Model version."""
     name: str
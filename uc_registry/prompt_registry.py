@@ -4,14 +4,60 @@ Prompt Registry using Unity Catalog.
 Stores and versions prompts in Unity Catalog Volumes.
 """
 
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Tuple, Union
+from dataclasses import dataclass, replace
 from datetime import datetime
+from collections import OrderedDict
 import json
+import logging
+import mmap
 import os
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# Bound once at import; only present inside Databricks runtimes
+try:
+    import dbutils as _dbutils
+except ImportError:
+    _dbutils = None
+
+logger = logging.getLogger(__name__)
+
+
+# Max parsed prompt versions kept per registry by _load_prompt
+_PROMPT_CACHE_SIZE = 256
+
+# Prompt files at least this large are mmapped and decoded in place; below it
+# the mapping setup costs more than the copy made by read()
+_MMAP_MIN_SIZE = 4096
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Serialize a prompt record as indented UTF-8 JSON (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def _loads(data: Union[bytes, memoryview]) -> Dict[str, Any]:
+    """Parse a prompt record (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    # json only takes str/bytes, so a memoryview is copied out here
+    return json.loads(bytes(data))
+
+
+@dataclass(frozen=True)
 class PromptMetadata:
     """Metadata for a prompt version."""
     name: str
@@ -22,7 +68,7 @@ class PromptMetadata:
     metrics: Dict[str, float]
 
 
-@dataclass
+@dataclass(frozen=True)
 class PromptVersion:
     """A versioned prompt."""
     name: str
@@ -32,6 +78,40 @@ class PromptVersion:
     metadata: Optional[PromptMetadata] = None
 
 
+def _decode_prompt(raw: Union[bytes, memoryview]) -> PromptVersion:
+    """
+    Decode a ``prompt.json`` record into a PromptVersion.
+    
+    With msgspec installed, the record is decoded straight into the dataclasses
+    in one pass; records it can't type (e.g. written before metadata carried
+    its own name/version) go through the dict-based path.
+    """
+    if MSGSPEC_AVAILABLE:
+        try:
+            return msgspec.json.decode(raw, type=PromptVersion)
+        except msgspec.ValidationError:
+            pass
+    
+    data = _loads(raw)
+    meta = data.get("metadata")
+    metadata = PromptMetadata(
+        name=meta.get("name", data["name"]),
+        version=meta.get("version", data["version"]),
+        created_at=datetime.fromisoformat(meta["created_at"]),
+        created_by=meta["created_by"],
+        tags=meta.get("tags", {}),
+        metrics=meta.get("metrics", {})
+    ) if meta else None
+    
+    return PromptVersion(
+        name=data["name"],
+        version=data["version"],
+        prompt_text=data["prompt_text"],
+        system_prompt=data.get("system_prompt"),
+        metadata=metadata
+    )
+
+
 class PromptRegistry:
     """
     Prompt registry using Unity Catalog.
@@ -77,6 +157,10 @@ class PromptRegistry:
         self.volume = volume
         self._base_path = f"/Volumes/{catalog}/{schema}/{volume}"
         self._in_databricks = "DATABRICKS_RUNTIME_VERSION" in os.environ
+        # (name, version) -> ((st_ino, st_mtime_ns) of prompt.json, parsed prompt), LRU order
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[Tuple[int, int], PromptVersion]]" = OrderedDict()
+        # name -> next free "v<N>" number; the directory is scanned only on first use
+        self._next_version: Dict[str, int] = {}
         
     def register_prompt(
         self,
@@ -125,9 +209,51 @@ class PromptRegistry:
         
         # Save to Unity Catalog Volume
         self._save_prompt(prompt_version)
+        self._note_version(name, version)
         
         return prompt_version
     
+    def bulk_register(self, prompts: List[PromptVersion]) -> List[PromptVersion]:
+        """
+        Register many prompt versions in one pass.
+        
+        Every ``prompt.json`` is written first, then each prompt name's
+        ``latest`` link is repointed once (to its last version in ``prompts``)
+        instead of once per version. Prompts without metadata get it filled in
+        as ``register_prompt`` would.
+        
+        Args:
+            prompts: Prompt versions to store, in registration order
+            
+        Returns:
+            The stored PromptVersion objects (copies, where metadata was filled in)
+        """
+        created_by = None
+        latest: Dict[str, str] = {}
+        stored: List[PromptVersion] = []
+        
+        for prompt_version in prompts:
+            if prompt_version.metadata is None:
+                if created_by is None:
+                    created_by = self._get_user()
+                prompt_version = replace(prompt_version, metadata=PromptMetadata(
+                    name=prompt_version.name,
+                    version=prompt_version.version,
+                    created_at=datetime.now(),
+                    created_by=created_by,
+                    tags={},
+                    metrics={}
+                ))
+            stored.append(prompt_version)
+            latest[prompt_version.name] = self._write_prompt_file(prompt_version)
+            self._note_version(prompt_version.name, prompt_version.version)
+        
+        for name, path in latest.items():
+            self._update_latest(name, path)
+        
+        logger.info("Registered %d prompt version(s) across %d prompt(s)", len(stored), len(latest))
+        return stored
+    
     def get_prompt(
         self,
         name: str,
@@ -158,23 +284,40 @@ class PromptRegistry:
         Returns:
             List of version identifiers
         """
-        prompt_dir = f"{self._base_path}/{name}"
-        
-        if not self._in_databricks:
-            # Local fallback
-            if os.path.exists(prompt_dir):
-                return [d for d in os.listdir(prompt_dir) if os.path.isdir(os.path.join(prompt_dir, d))]
+        if self._in_databricks:
+            return self._list_versions_dbx(name)
+        return self._list_versions_local(name)
+    
+    def _list_versions_local(self, name: str) -> List[str]:
+        """List versions from a local directory (outside Databricks)."""
+        # One scandir pass; dirent types avoid a stat per entry,
+        # and follow_symlinks=False leaves out the "latest" alias
+        try:
+            with os.scandir(f"{self._base_path}/{name}") as entries:
+                return [e.name for e in entries if e.is_dir(follow_symlinks=False)]
+        except FileNotFoundError:
+            return []
+    
+    def _list_versions_dbx(self, name: str) -> List[str]:
+        """List versions from the Unity Catalog Volume via dbutils."""
+        if _dbutils is None:
             return []
-        
         try:
-            import dbutils
-            files = dbutils.fs.ls(prompt_dir)
-            return [f.name.rstrip('/') for f in files if f.isDir()]
-        except:
+            files = _dbutils.fs.ls(f"{self._base_path}/{name}")
+        except Exception:
+            # dbutils raises (a wrapped Java exception) for a missing directory
             return []
+        return [f.name.rstrip('/') for f in files if f.isDir()]
     
     def _save_prompt(self, prompt_version: PromptVersion):
         """Save prompt to Unity Catalog Volume."""
+        path = self._write_prompt_file(prompt_version)
+        self._update_latest(prompt_version.name, path)
+        
+        logger.info("Registered prompt: %s/%s", prompt_version.name, prompt_version.version)
+    
+    def _write_prompt_file(self, prompt_version: PromptVersion) -> str:
+        """Write ``prompt.json`` for one version; returns the version directory."""
         path = f"{self._base_path}/{prompt_version.name}/{prompt_version.version}"
         
         # Create directory
@@ -182,80 +325,102 @@ class PromptRegistry:
         
         # Save prompt
         prompt_file = os.path.join(path, "prompt.json")
-        with open(prompt_file, 'w') as f:
-            json.dump({
+        with open(prompt_file, 'wb') as f:
+            f.write(_dumps({
                 "name": prompt_version.name,
                 "version": prompt_version.version,
                 "prompt_text": prompt_version.prompt_text,
                 "system_prompt": prompt_version.system_prompt,
                 "metadata": {
+                    "name": prompt_version.metadata.name,
+                    "version": prompt_version.metadata.version,
                     "created_at": prompt_version.metadata.created_at.isoformat(),
                     "created_by": prompt_version.metadata.created_by,
                     "tags": prompt_version.metadata.tags,
                     "metrics": prompt_version.metadata.metrics
-                } if prompt_version.metadata else {}
-            }, f, indent=2)
-        
-        # Update latest symlink
-        latest_path = f"{self._base_path}/{prompt_version.name}/latest"
-        if os.path.exists(latest_path):
-            os.remove(latest_path)
-        os.symlink(path, latest_path)
+                } if prompt_version.metadata else None
+            }))
         
-        print(f"✅ Registered prompt: {prompt_version.name}/{prompt_version.version}")
+        return path
+    
+    def _update_latest(self, name: str, path: str):
+        """Point the prompt's ``latest`` symlink at a version directory."""
+        latest_path = f"{self._base_path}/{name}/latest"
+        # Build the new link beside the old one and rename it over, so readers
+        # never see "latest" missing; the pid keeps concurrent writers apart
+        tmp_path = f"{latest_path}.{os.getpid()}.tmp"
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        os.symlink(path, tmp_path)
+        os.replace(tmp_path, latest_path)
     
     def _load_prompt(self, name: str, version: str) -> Optional[PromptVersion]:
         """Load prompt from Unity Catalog Volume."""
         path = f"{self._base_path}/{name}/{version}/prompt.json"
         
-        if not os.path.exists(path):
+        # stat follows the "latest" symlink, so repointing it changes the signature
+        try:
+            st = os.stat(path)
+        except OSError:
             return None
+        signature = (st.st_ino, st.st_mtime_ns)
+        
+        key = (name, version)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == signature:
+            self._cache.move_to_end(key)
+            return cached[1]
         
         try:
-            with open(path, 'r') as f:
-                data = json.load(f)
-            
-            metadata = PromptMetadata(
-                name=data["name"],
-                version=data["version"],
-                created_at=datetime.fromisoformat(data["metadata"]["created_at"]),
-                created_by=data["metadata"]["created_by"],
-                tags=data["metadata"].get("tags", {}),
-                metrics=data["metadata"].get("metrics", {})
-            )
-            
-            return PromptVersion(
-                name=data["name"],
-                version=data["version"],
-                prompt_text=data["prompt_text"],
-                system_prompt=data.get("system_prompt"),
-                metadata=metadata
-            )
-        except Exception as e:
-            print(f"⚠️  Failed to load prompt: {e}")
+            with open(path, 'rb') as f:
+                if st.st_size < _MMAP_MIN_SIZE:
+                    prompt_version = _decode_prompt(f.read())
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                        prompt_version = _decode_prompt(view)
+        except Exception:
+            logger.warning("Failed to load prompt: %s/%s", name, version, exc_info=True)
             return None
+        
+        self._cache[key] = (signature, prompt_version)
+        self._cache.move_to_end(key)
+        if len(self._cache) > _PROMPT_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return prompt_version
     
     def _get_next_version(self, name: str) -> int:
-        """Get next version number."""
-        versions = self.list_versions(name)
-        if not versions:
-            return 1
+        """
+        Get next version number.
+        
+        Scans the prompt's versions once per name, then counts up in memory;
+        versions registered by other processes afterwards are not seen.
+        """
+        if name in self._next_version:
+            return self._next_version[name]
         
         # Extract version numbers
         version_nums = []
-        for v in versions:
+        for v in self.list_versions(name):
             if v.startswith('v') and v[1:].isdigit():
                 version_nums.append(int(v[1:]))
         
-        return max(version_nums, default=0) + 1
+        next_version = self._next_version[name] = max(version_nums, default=0) + 1
+        return next_version
+    
+    def _note_version(self, name: str, version: str):
+        """Advance a seeded version counter past a newly stored "v<N>" version."""
+        # Unseeded names are left alone: their first _get_next_version scans the directory
+        if name in self._next_version and version.startswith('v') and version[1:].isdigit():
+            self._next_version[name] = max(self._next_version[name], int(version[1:]) + 1)
     
     def _get_user(self) -> str:
         """Get current user."""
-        if self._in_databricks:
+        if self._in_databricks and _dbutils is not None:
             try:
-                import dbutils
-                return dbutils.notebook.entry_point.getDbutils().notebook().getContext().userName().get()
-            except:
+                return _dbutils.notebook.entry_point.getDbutils().notebook().getContext().userName().get()
+            except Exception:
                 pass
         return os.environ.get("USER", "unknown")
 
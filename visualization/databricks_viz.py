@@ -18,9 +18,273 @@ Usage in Databricks:
     viz.show_decision_tree(decisions)
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Iterable, Iterator, Tuple, Union
+from collections import OrderedDict
 from datetime import datetime
+from html import escape
+import functools
+import hashlib
 import json
+import os
+import shutil
+import subprocess
+import tempfile
+import uuid
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Bar colours per action type, matching the Mermaid classDefs
+_ACTION_COLORS = {
+    "tool_call": "#90EE90",
+    "reasoning": "#FFD700",
+    "decision": "#87CEEB",
+}
+_DEFAULT_ACTION_COLOR = "#0066cc"
+
+# Mermaid node line per action type (% formatted with node number and name)
+_MERMAID_NODES = {
+    "tool_call": "    A%d[%s]:::tool",
+    "reasoning": "    A%d{%s}:::reasoning",
+    "decision": "    A%d{%s}:::decision",
+}
+_MERMAID_DEFAULT_NODE = "    A%d[%s]"
+_MERMAID_CLASS_DEFS = (
+    "    classDef tool fill:#90EE90,stroke:#2E8B57",
+    "    classDef reasoning fill:#FFD700,stroke:#FF8C00",
+    "    classDef decision fill:#87CEEB,stroke:#4682B4",
+)
+
+# Above this many actions the timeline is drawn with WebGL (scattergl) rather
+# than SVG bars, which need a DOM node per bar
+_WEBGL_MIN_ACTIONS = 500
+
+# Below this many actions the timeline is drawn as plain SVG, which renders
+# faster than loading and initializing Plotly
+_SVG_MAX_ACTIONS = 50
+
+# Most actions drawn in one graph or timeline
+_MAX_RENDERED_ACTIONS = 2000
+
+# Rendered fragments kept per generator
+_HTML_CACHE_SIZE = 128
+
+# Tool calls rendered in the browser per batch, as the list scrolls into view
+_TOOL_CALL_BATCH = 50
+
+# Pinned so browsers and CDNs can cache them across dashboards
+_PLOTLY_JS = "https://cdn.plot.ly/plotly-2.35.2.min.js"
+_MERMAID_JS = "https://cdn.jsdelivr.net/npm/mermaid@10.9.1/dist/mermaid.esm.min.mjs"
+
+# Prompt comparison card per version, and its metric items
+_VERSION_TMPL = """
+            <div class='viz-card'>
+                <h3>{name}</h3>
+                <pre class='viz-pre'>{prompt}</pre>
+                <div class='viz-metrics'>
+                    <strong>Metrics:</strong>
+                    <ul>
+                        {metrics}
+                    </ul>
+                </div>
+            </div>
+            """
+_METRIC_TMPL = "<li>{0}: {1}</li>"
+
+# Decision explanation factor item
+_FACTOR_TMPL = "<li><strong>{name}:</strong> {value} (weight: {weight})</li>"
+
+# One tool call in the tool calls viewer; also the <template> its script clones
+_TOOL_CALL_TMPL = """
+                <details class='viz-tool'>
+                    <summary>
+                        🔧 <span class='tc-name'>{name}</span> <span class='viz-muted'>(<span class='tc-ms'>{ms}</span>ms)</span>
+                    </summary>
+                    <div class='viz-tool-body'>
+                        <h4>Input:</h4>
+                        <pre class='viz-pre tc-in'>{input}</pre>
+                        <h4>Output:</h4>
+                        <pre class='viz-pre tc-out'>{output}</pre>
+                    </div>
+                </details>"""
+
+# Renders every .mermaid element on the page; included once per document
+_MERMAID_SCRIPT = f"""
+        <script type="module">
+            import mermaid from '{_MERMAID_JS}';
+            mermaid.initialize({{ startOnLoad: true, theme: 'default' }});
+        </script>
+"""
+
+# Longest wait for one mermaid-cli render
+_MMDC_TIMEOUT = 60
+
+
+def _dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize trace data for embedding in HTML (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(obj, option=option).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the json module handles
+            pass
+    return json.dumps(obj, indent=2 if pretty else None)
+
+
+def _script_json(obj: Any) -> str:
+    """
+    Serialize data for an inline <script> block.
+    
+    "<" is written as its JSON escape so trace text can't close the block.
+    """
+    return _dumps(obj).replace("<", "\\u003c")
+
+
+def _escape(value: Any) -> str:
+    """HTML-escape a trace value for use as element text or an attribute."""
+    return escape(str(value))
+
+
+def _mermaid_div(src: str) -> str:
+    """Wrap Mermaid source for client-side rendering (mermaid decodes the entities)."""
+    return f"""
+        <div class="mermaid">
+        {escape(src, quote=False)}
+        </div>
+"""
+
+
+def _digest(obj: Any) -> str:
+    """Stable content hash of trace data, for cache keys."""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(obj, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _detect_environment() -> Tuple[Any, bool]:
+    """
+    Find the running IPython shell, once per process.
+    
+    Returns (shell or None, whether it's a notebook shell). Done on first use
+    rather than at import, since importing IPython takes hundreds of ms.
+    """
+    try:
+        import IPython
+    except ImportError:
+        return None, False
+    ipython = IPython.get_ipython()
+    return ipython, hasattr(ipython, 'run_cell')
+
+
+@functools.lru_cache(maxsize=32)
+def _mermaid_svg(src: str) -> str:
+    """
+    Render Mermaid source to SVG with mermaid-cli (mmdc), cached by source.
+    
+    Raises OSError or SubprocessError on failure; lru_cache doesn't keep
+    exceptions, so a missing mmdc or a failed render is retried next time.
+    """
+    mmdc = shutil.which("mmdc")
+    if mmdc is None:
+        raise FileNotFoundError("mmdc")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        src_path = os.path.join(tmp, "graph.mmd")
+        svg_path = os.path.join(tmp, "graph.svg")
+        with open(src_path, "w", encoding="utf-8") as f:
+            f.write(src)
+        subprocess.run(
+            [mmdc, "-i", src_path, "-o", svg_path, "-b", "transparent"],
+            check=True, capture_output=True, timeout=_MMDC_TIMEOUT
+        )
+        with open(svg_path, encoding="utf-8") as f:
+            return f.read()
+
+
+def _render_mermaid_svg(src: str) -> Optional[str]:
+    """
+    Render Mermaid source to SVG, or None when mmdc isn't installed or fails.
+    
+    Callers fall back to shipping the Mermaid source for the browser to render.
+    Only successful renders are cached.
+    """
+    try:
+        return _mermaid_svg(src)
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _memoize_html(key_of: Callable[..., Any]) -> Callable[[Callable[..., str]], Callable[..., str]]:
+    """
+    Cache a generator's output by a digest of the data it reads.
+    
+    key_of(*args) picks that data out of the generator's arguments (e.g. a
+    trace's actions), so unrelated parts of a trace neither cost hashing time
+    nor split the cache. The generators depend only on their arguments, so one
+    LRU per generator is shared by every visualizer: re-rendering the same
+    trace in another view (or from a fresh visualizer, as
+    create_databricks_widget does) is a lookup. Data that can't be hashed
+    (non-string keys, integers orjson can't represent) is rendered uncached.
+    """
+    def decorate(generate: Callable[..., str]) -> Callable[..., str]:
+        cache: "OrderedDict[str, str]" = OrderedDict()
+        
+        @functools.wraps(generate)
+        def wrapper(self, *args):
+            try:
+                key = _digest(key_of(*args))
+            except (TypeError, ValueError):
+                return generate(self, *args)
+            html = cache.get(key)
+            if html is not None:
+                cache.move_to_end(key)
+                return html
+            
+            html = generate(self, *args)
+            cache[key] = html
+            if len(cache) > _HTML_CACHE_SIZE:
+                cache.popitem(last=False)
+            return html
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    
+    return decorate
+
+
+def _duration_ms(action: Dict[str, Any], default: float = 0) -> float:
+    """An action's duration as a number; None (still running) or junk counts as 0."""
+    value = action.get("duration_ms", default)
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _aggregate_actions(actions: List[Dict[str, Any]], max_points: int = _MAX_RENDERED_ACTIONS) -> List[Dict[str, Any]]:
+    """
+    Downsample actions to at most max_points, preserving the trace's shape.
+    
+    The actions are split into max_points contiguous buckets and the longest
+    action (by duration_ms) in each is kept, so slow steps always survive.
+    """
+    n = len(actions)
+    if n <= max_points:
+        return actions
+    return [
+        max(actions[b * n // max_points:(b + 1) * n // max_points], key=_duration_ms)
+        for b in range(max_points)
+    ]
 
 
 class DatabricksVisualizer:
@@ -40,19 +304,40 @@ class DatabricksVisualizer:
     - Standalone Python
     """
     
+    # Styles for the decision, tool call, prompt and explanation views, sent
+    # once per displayed document rather than inlined on every element
+    _CSS = """
+        <style>
+            .viz-decisions { font-family: monospace; }
+            .viz-decision { margin: 10px 0; padding: 10px; background: #f0f0f0; border-left: 4px solid #0066cc; }
+            .viz-muted { color: #666; font-weight: normal; }
+            .viz-pre { background: #f5f5f5; padding: 10px; border-radius: 4px; white-space: pre-wrap; }
+            .viz-tool { margin: 10px 0; padding: 15px; background: white; border: 1px solid #ddd; border-radius: 4px; }
+            .viz-tool summary { cursor: pointer; font-weight: bold; color: #0066cc; }
+            .viz-tool-body { margin-top: 10px; }
+            .viz-prompts { display: grid; grid-template-columns: repeat(auto-fit, minmax(400px, 1fr)); gap: 20px; }
+            .viz-card { border: 1px solid #ddd; border-radius: 4px; padding: 15px; background: white; }
+            .viz-card h3 { margin-top: 0; color: #0066cc; }
+            .viz-metrics { margin-top: 10px; padding-top: 10px; border-top: 1px solid #ddd; }
+            .viz-metrics ul { margin: 5px 0; }
+            .viz-explain { background: #fff3cd; border-left: 4px solid #ffc107; padding: 20px; margin: 20px 0; }
+            .viz-explain h3 { margin-top: 0; }
+            .viz-explain .viz-pre { background: white; }
+            .viz-block { margin: 15px 0; }
+        </style>
+    """
+    
     def __init__(self):
         """Initialize visualizer."""
         self._check_environment()
+        # IPython.display and mlflow, bound on first use
+        self._HTML = None
+        self._display_fn = None
+        self._mlflow = None
     
     def _check_environment(self):
         """Check if running in Databricks."""
-        try:
-            import IPython
-            self.ipython = IPython.get_ipython()
-            self.in_databricks = hasattr(self.ipython, 'run_cell')
-        except:
-            self.ipython = None
-            self.in_databricks = False
+        self.ipython, self.in_databricks = _detect_environment()
     
     def show_execution_graph(self, trace: Dict[str, Any]):
         """
@@ -61,18 +346,7 @@ class DatabricksVisualizer:
         Args:
             trace: Execution trace with actions/decisions
         """
-        mermaid = self._generate_mermaid(trace)
-        html = f"""
-        <div class="mermaid">
-        {mermaid}
-        </div>
-        <script type="module">
-            import mermaid from 'https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.esm.min.mjs';
-            mermaid.initialize({{ startOnLoad: true, theme: 'default' }});
-        </script>
-        """
-        
-        self._display(html)
+        self._display((_mermaid_div(self._generate_mermaid(trace)), _MERMAID_SCRIPT))
     
     def show_timeline(self, trace: Dict[str, Any]):
         """
@@ -91,8 +365,7 @@ class DatabricksVisualizer:
         Args:
             decisions: List of agent decisions
         """
-        html = self._generate_decision_tree_html(decisions)
-        self._display(html)
+        self._display((self._CSS, self._generate_decision_tree_html(decisions)))
     
     def show_tool_calls(self, tool_calls: List[Dict[str, Any]]):
         """
@@ -101,8 +374,7 @@ class DatabricksVisualizer:
         Args:
             tool_calls: List of tool calls with inputs/outputs
         """
-        html = self._generate_tool_calls_html(tool_calls)
-        self._display(html)
+        self._display((self._CSS, self._generate_tool_calls_html(tool_calls)))
     
     def compare_prompts(self, versions: List[Dict[str, Any]]):
         """
@@ -111,8 +383,7 @@ class DatabricksVisualizer:
         Args:
             versions: List of prompt versions
         """
-        html = self._generate_prompt_comparison_html(versions)
-        self._display(html)
+        self._display((self._CSS, self._generate_prompt_comparison_html(versions)))
     
     def explain_decision(self, decision: Dict[str, Any], context: Dict[str, Any]):
         """
@@ -122,8 +393,7 @@ class DatabricksVisualizer:
             decision: Decision to explain
             context: Context information
         """
-        html = self._generate_explanation_html(decision, context)
-        self._display(html)
+        self._display((self._CSS, self._generate_explanation_html(decision, context)))
     
     def create_dashboard(self, trace: Dict[str, Any]):
         """
@@ -132,252 +402,366 @@ class DatabricksVisualizer:
         Args:
             trace: Complete execution trace
         """
-        html = f"""
+        self._display(self._iter_dashboard(trace))
+    
+    def _iter_dashboard(self, trace: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield the dashboard document a section at a time.
+        
+        Each section is rendered just before it is yielded; the Mermaid script
+        comes once at the end, after every graph it renders.
+        """
+        yield """
         <html>
         <head>
             <style>
-                body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; margin: 0; padding: 20px; background: #f5f5f5; }}
-                .dashboard {{ max-width: 1400px; margin: 0 auto; }}
-                .section {{ background: white; border-radius: 8px; padding: 20px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-                .section h2 {{ margin-top: 0; color: #333; border-bottom: 2px solid #0066cc; padding-bottom: 10px; }}
-                .tabs {{ display: flex; gap: 10px; margin-bottom: 20px; }}
-                .tab {{ padding: 10px 20px; background: #e0e0e0; border-radius: 4px; cursor: pointer; }}
-                .tab.active {{ background: #0066cc; color: white; }}
+                body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; margin: 0; padding: 20px; background: #f5f5f5; }
+                .dashboard { max-width: 1400px; margin: 0 auto; }
+                .section { background: white; border-radius: 8px; padding: 20px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+                .section h2 { margin-top: 0; color: #333; border-bottom: 2px solid #0066cc; padding-bottom: 10px; }
+                .tabs { display: flex; gap: 10px; margin-bottom: 20px; }
+                .tab { padding: 10px 20px; background: #e0e0e0; border-radius: 4px; cursor: pointer; }
+                .tab.active { background: #0066cc; color: white; }
             </style>
+        """
+        yield self._CSS
+        yield """
         </head>
         <body>
             <div class="dashboard">
                 <h1>🔍 Agent Execution Dashboard</h1>
-                
+        """
+        yield f"""
                 <div class="section">
                     <h2>📊 Execution Graph</h2>
-                    <div id="graph"></div>
+                    <div id="graph">{_mermaid_div(self._generate_mermaid(trace))}</div>
                 </div>
-                
+        """
+        yield f"""
                 <div class="section">
                     <h2>⏱️ Timeline</h2>
-                    <div id="timeline"></div>
+                    {self._generate_timeline_html(trace)}
                 </div>
-                
+        """
+        yield f"""
                 <div class="section">
                     <h2>🔧 Tool Calls</h2>
-                    <div id="toolcalls"></div>
+                    <div id="toolcalls">{self._generate_tool_calls_html(trace.get("tool_calls", []))}</div>
                 </div>
-                
+        """
+        yield f"""
                 <div class="section">
                     <h2>🤔 Decisions</h2>
-                    <div id="decisions"></div>
+                    <div id="decisions">{self._generate_decision_tree_html(trace.get("decisions", []))}</div>
                 </div>
             </div>
+        """
+        yield _MERMAID_SCRIPT
+        yield """
         </body>
         </html>
         """
-        self._display(html)
     
+    @_memoize_html(lambda trace: trace.get("actions", []))
     def _generate_mermaid(self, trace: Dict[str, Any]) -> str:
         """Generate Mermaid diagram from trace."""
-        actions = trace.get("actions", [])
+        actions = _aggregate_actions(trace.get("actions", []))
+        n = len(actions)
         
-        lines = ["graph TD"]
-        lines.append("    Start([Start]) --> A1")
+        # Header, a node line and an edge line per action, then the classDefs
+        lines = [None] * (2 * n + 5)
+        lines[0] = "graph TD"
+        lines[1] = "    Start([Start]) --> A1"
         
-        for i, action in enumerate(actions):
-            node_id = f"A{i+1}"
-            action_type = action.get("type", "unknown")
-            action_name = action.get("name", "Unknown")
-            
+        for i, action in enumerate(actions, 1):
             # Style based on action type
-            if action_type == "tool_call":
-                lines.append(f"    {node_id}[{action_name}]:::tool")
-            elif action_type == "reasoning":
-                lines.append(f"    {node_id}{{{action_name}}}:::reasoning")
-            elif action_type == "decision":
-                lines.append(f"    {node_id}{{{action_name}}}:::decision")
-            else:
-                lines.append(f"    {node_id}[{action_name}]")
-            
-            # Add edge to next
-            if i < len(actions) - 1:
-                lines.append(f"    {node_id} --> A{i+2}")
-        
-        # Final node
-        if actions:
-            last_id = f"A{len(actions)}"
-            lines.append(f"    {last_id} --> End([End])")
+            tmpl = _MERMAID_NODES.get(action.get("type"), _MERMAID_DEFAULT_NODE)
+            lines[2 * i] = tmpl % (i, action.get("name", "Unknown"))
+            # Edge to the next action, or to End from the last
+            lines[2 * i + 1] = "    A%d --> A%d" % (i, i + 1) if i < n else "    A%d --> End([End])" % i
         
-        # Styling
-        lines.append("    classDef tool fill:#90EE90,stroke:#2E8B57")
-        lines.append("    classDef reasoning fill:#FFD700,stroke:#FF8C00")
-        lines.append("    classDef decision fill:#87CEEB,stroke:#4682B4")
+        lines[-3:] = _MERMAID_CLASS_DEFS
         
         return "\n".join(lines)
     
+    @_memoize_html(lambda trace: trace.get("actions", []))
     def _generate_timeline_html(self, trace: Dict[str, Any]) -> str:
-        """Generate Plotly timeline."""
-        actions = trace.get("actions", [])
-        
-        # Build Plotly data
-        tasks = []
-        for i, action in enumerate(actions):
-            tasks.append({
-                "Task": action.get("name", f"Action {i}"),
-                "Start": action.get("start_time", 0),
-                "Duration": action.get("duration_ms", 100)
-            })
+        """Generate timeline (plain SVG for short traces, Plotly otherwise)."""
+        original_count = len(trace.get("actions", []))
+        actions = _aggregate_actions(trace.get("actions", []))
+        
+        xs = [_duration_ms(action, 100) for action in actions]
+        ys = [action.get("name", f"Action {i}") for i, action in enumerate(actions)]
+        colors = [_ACTION_COLORS.get(action.get("type"), _DEFAULT_ACTION_COLOR) for action in actions]
+        
+        if len(actions) < _SVG_MAX_ACTIONS:
+            return self._generate_timeline_svg(xs, ys, colors, original_count)
+        if len(actions) > _WEBGL_MIN_ACTIONS:
+            traces = self._timeline_webgl_traces(xs, ys, colors)
+        else:
+            # One bar trace for all actions: Plotly's cost grows with the number
+            # of traces far more than with the number of points in a trace
+            traces = [{
+                "x": xs,
+                "y": list(range(len(xs))),
+                "text": [f"{d}ms" for d in xs],
+                "hovertext": ys,
+                "hoverinfo": "text+x",
+                "type": "bar",
+                "orientation": "h",
+                "textposition": "auto",
+                "marker": {"color": colors}
+            }]
+        
+        # Bars sit on one row per action (y = action index) labelled with its
+        # name, so repeated names (the same tool called again) don't overlap
+        layout = {
+            "title": "Execution Timeline",
+            "xaxis": {"title": "Duration (ms)"},
+            "yaxis": {"tickmode": "array", "tickvals": list(range(len(ys))), "ticktext": ys},
+            "height": 400
+        }
         
         html = f"""
-        <div id="timeline"></div>
-        <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
+        <div id="timeline" data-original-count="{original_count}"></div>
+        <script defer src="{_PLOTLY_JS}" crossorigin="anonymous"></script>
         <script>
-            var data = {json.dumps(tasks)};
-            var traces = data.map(function(task, i) {{
-                return {{
-                    x: [task.Duration],
-                    y: [task.Task],
-                    name: task.Task,
-                    type: 'bar',
-                    orientation: 'h',
-                    text: task.Duration + 'ms',
-                    textposition: 'auto'
-                }};
-            }});
-            
-            var layout = {{
-                title: 'Execution Timeline',
-                xaxis: {{ title: 'Duration (ms)' }},
-                barmode: 'stack',
-                height: 400
-            }};
-            
-            Plotly.newPlot('timeline', traces, layout);
+            (function() {{
+                var layout = {_script_json(layout)};
+                
+                function draw() {{
+                    Plotly.newPlot('timeline', {_script_json(traces)}, layout);
+                }}
+                
+                // Plotly is deferred: wait for it while the page is still parsing,
+                // or for the script itself when inserted into a loaded notebook
+                if (document.readyState === 'loading') {{
+                    document.addEventListener('DOMContentLoaded', draw);
+                }} else if (window.Plotly) {{
+                    draw();
+                }} else {{
+                    document.querySelector('script[src="{_PLOTLY_JS}"]').addEventListener('load', draw);
+                }}
+            }})();
         </script>
         """
         
         return html
     
+    def _generate_timeline_svg(self, xs: List[Any], ys: List[str], colors: List[str], original_count: int) -> str:
+        """Draw timeline bars as SVG rects, scaled so the longest fills the chart."""
+        label_width, bar_width, row_height, top = 200, 720, 20, 30
+        scale = bar_width / (max(xs, default=0) or 1)
+        
+        parts = [
+            f"<div id='timeline' data-original-count='{original_count}'>"
+            f"<svg viewBox='0 0 1000 {top + row_height * len(xs)}' width='100%' "
+            f"font-family='sans-serif' font-size='12'>"
+            f"<text x='500' y='18' text-anchor='middle' font-size='16'>Execution Timeline</text>"
+        ]
+        for row, (x, y, color) in enumerate(zip(xs, ys, colors)):
+            y_px = top + row * row_height
+            width = x * scale
+            name, duration = _escape(y), _escape(x)
+            parts.append(
+                f"<text x='{label_width - 6}' y='{y_px + 12}' text-anchor='end'>{name}</text>"
+                f"<rect x='{label_width}' y='{y_px}' width='{width:.1f}' height='16' fill='{color}'>"
+                f"<title>{name}: {duration}ms</title></rect>"
+                f"<text x='{label_width + width + 4:.1f}' y='{y_px + 12}'>{duration}ms</text>"
+            )
+        parts.append("</svg></div>")
+        return "".join(parts)
+    
+    def _timeline_webgl_traces(self, xs: List[Any], ys: List[str], colors: List[str]) -> List[Dict]:
+        """
+        Draw timeline bars as thick scattergl line segments.
+        
+        Each bar becomes a 0 -> duration segment on its action's row, followed
+        by a null gap. A WebGL line has a single colour, so there is one trace
+        per colour.
+        """
+        by_color: Dict[str, Dict[str, list]] = {}
+        for row, (x, y, color) in enumerate(zip(xs, ys, colors)):
+            segments = by_color.setdefault(color, {"x": [], "y": [], "text": []})
+            segments["x"] += [0, x, None]
+            segments["y"] += [row, row, None]
+            segments["text"] += [f"{y}: {x}ms", f"{y}: {x}ms", None]
+        
+        return [
+            {
+                **segments,
+                "type": "scattergl",
+                "mode": "lines",
+                "hoverinfo": "text",
+                "line": {"color": color, "width": 8},
+                "showlegend": False
+            }
+            for color, segments in by_color.items()
+        ]
+    
+    @_memoize_html(lambda decisions: decisions)
     def _generate_decision_tree_html(self, decisions: List[Dict]) -> str:
         """Generate decision tree visualization."""
-        html = "<div style='font-family: monospace;'>"
+        parts = ["<div class='viz-decisions'>"]
+        names = map(_escape, (d.get("name", "Decision") for d in decisions))
+        reasons = map(_escape, (d.get("reason", "No reason provided") for d in decisions))
         
-        for i, decision in enumerate(decisions):
+        for decision, name, reason in zip(decisions, names, reasons):
             indent = "  " * decision.get("depth", 0)
-            name = decision.get("name", "Decision")
-            reason = decision.get("reason", "No reason provided")
             
-            html += f"""
-            <div style='margin: 10px 0; padding: 10px; background: #f0f0f0; border-left: 4px solid #0066cc;'>
+            parts.append(f"""
+            <div class='viz-decision'>
                 <strong>{indent}├─ {name}</strong><br>
-                <span style='color: #666;'>{indent}   {reason}</span>
+                <span class='viz-muted'>{indent}   {reason}</span>
             </div>
-            """
+            """)
         
-        html += "</div>"
-        return html
+        parts.append("</div>")
+        return "".join(parts)
     
+    @_memoize_html(lambda tool_calls: tool_calls)
     def _generate_tool_calls_html(self, tool_calls: List[Dict]) -> str:
-        """Generate tool calls viewer."""
-        html = "<div>"
-        
-        for i, call in enumerate(tool_calls):
-            tool_name = call.get("tool", "Unknown")
-            input_data = json.dumps(call.get("input", {}), indent=2)
-            output_data = json.dumps(call.get("output", {}), indent=2)
-            duration = call.get("duration_ms", 0)
-            
-            html += f"""
-            <details style='margin: 10px 0; padding: 15px; background: white; border: 1px solid #ddd; border-radius: 4px;'>
-                <summary style='cursor: pointer; font-weight: bold; color: #0066cc;'>
-                    🔧 {tool_name} <span style='color: #666; font-weight: normal;'>({duration}ms)</span>
-                </summary>
-                <div style='margin-top: 10px;'>
-                    <h4>Input:</h4>
-                    <pre style='background: #f5f5f5; padding: 10px; border-radius: 4px;'>{input_data}</pre>
-                    <h4>Output:</h4>
-                    <pre style='background: #f5f5f5; padding: 10px; border-radius: 4px;'>{output_data}</pre>
-                </div>
-            </details>
-            """
+        """
+        Generate tool calls viewer.
         
-        html += "</div>"
-        return html
+        The first batch of calls is rendered as static HTML, so the view still
+        shows them where scripts don't run (untrusted notebooks, exports). The
+        rest are embedded once as a JSON data island and cloned from a
+        <template> in the browser, a batch at a time as the end of the list
+        scrolls into view.
+        """
+        calls = [
+            {
+                "tool": call.get("tool", "Unknown"),
+                "duration_ms": call.get("duration_ms", 0),
+                "input": call.get("input", {}),
+                "output": call.get("output", {})
+            }
+            for call in tool_calls
+        ]
+        first, rest = calls[:_TOOL_CALL_BATCH], calls[_TOOL_CALL_BATCH:]
+        
+        static = "".join(
+            _TOOL_CALL_TMPL.format(
+                name=_escape(call["tool"]),
+                ms=_escape(call["duration_ms"]),
+                input=escape(_dumps(call["input"], pretty=True), quote=False),
+                output=escape(_dumps(call["output"], pretty=True), quote=False)
+            )
+            for call in first
+        )
+        if not rest:
+            return f"<div>{static}\n        </div>"
+        
+        # Scripts find their view by this id: document.currentScript is unreliable
+        # where notebooks re-insert output scripts elsewhere (e.g. classic Jupyter)
+        view_id = f"tc-{uuid.uuid4().hex}"
+        return f"""
+        <div data-tc='{view_id}'>{static}
+            <template>{_TOOL_CALL_TMPL.format(name="", ms="", input="", output="")}
+            </template>
+            <script type="application/json">{_script_json(rest)}</script>
+            <div class='tc-more viz-muted'>{len(rest)} more tool calls (shown when JavaScript runs)</div>
+            <script>
+            document.querySelectorAll('[data-tc="{view_id}"]:not([data-tc-ready])').forEach(function(root) {{
+                root.setAttribute('data-tc-ready', '');
+                var calls = JSON.parse(root.querySelector('script[type="application/json"]').textContent);
+                var template = root.querySelector('template');
+                var more = root.querySelector('.tc-more');
+                var next = 0;
+                more.textContent = '';
+                var observer = new IntersectionObserver(function(entries) {{
+                    if (!entries[0].isIntersecting) return;
+                    for (var end = Math.min(next + {_TOOL_CALL_BATCH}, calls.length); next < end; next++) {{
+                        var call = calls[next], node = template.content.cloneNode(true);
+                        node.querySelector('.tc-name').textContent = call.tool;
+                        node.querySelector('.tc-ms').textContent = call.duration_ms;
+                        node.querySelector('.tc-in').textContent = JSON.stringify(call.input, null, 2);
+                        node.querySelector('.tc-out').textContent = JSON.stringify(call.output, null, 2);
+                        root.insertBefore(node, more);
+                    }}
+                    // Re-observe so a marker still in view after this batch fires again
+                    observer.unobserve(more);
+                    if (next < calls.length) observer.observe(more);
+                }});
+                observer.observe(more);
+            }});
+            </script>
+        </div>
+        """
     
     def _generate_prompt_comparison_html(self, versions: List[Dict]) -> str:
         """Generate prompt comparison view."""
-        html = """
-        <div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(400px, 1fr)); gap: 20px;'>
-        """
+        parts = ["""
+        <div class='viz-prompts'>
+        """]
         
         for version in versions:
-            version_name = version.get("version", "Unknown")
-            prompt = version.get("prompt", "")
             metrics = version.get("metrics", {})
-            
-            html += f"""
-            <div style='border: 1px solid #ddd; border-radius: 4px; padding: 15px; background: white;'>
-                <h3 style='margin-top: 0; color: #0066cc;'>{version_name}</h3>
-                <pre style='background: #f5f5f5; padding: 10px; border-radius: 4px; white-space: pre-wrap;'>{prompt}</pre>
-                <div style='margin-top: 10px; padding-top: 10px; border-top: 1px solid #ddd;'>
-                    <strong>Metrics:</strong>
-                    <ul style='margin: 5px 0;'>
-                        {"".join(f"<li>{k}: {v}</li>" for k, v in metrics.items())}
-                    </ul>
-                </div>
-            </div>
-            """
+            parts.append(_VERSION_TMPL.format_map({
+                "name": _escape(version.get("version", "Unknown")),
+                "prompt": _escape(version.get("prompt", "")),
+                "metrics": "".join([_METRIC_TMPL.format(_escape(k), _escape(v)) for k, v in metrics.items()])
+            }))
         
-        html += "</div>"
-        return html
+        parts.append("</div>")
+        return "".join(parts)
     
     def _generate_explanation_html(self, decision: Dict, context: Dict) -> str:
         """Generate decision explanation."""
-        html = f"""
-        <div style='background: #fff3cd; border-left: 4px solid #ffc107; padding: 20px; margin: 20px 0;'>
-            <h3 style='margin-top: 0;'>🤔 Why did the agent decide: "{decision.get('action', 'Unknown')}"?</h3>
+        parts = [f"""
+        <div class='viz-explain'>
+            <h3>🤔 Why did the agent decide: "{_escape(decision.get('action', 'Unknown'))}"?</h3>
             
-            <div style='margin: 15px 0;'>
+            <div class='viz-block'>
                 <h4>Decision Factors:</h4>
                 <ul>
-        """
+        """]
         
-        factors = decision.get("factors", [])
-        for factor in factors:
-            html += f"<li><strong>{factor.get('name', 'Factor')}:</strong> {factor.get('value', 'N/A')} (weight: {factor.get('weight', 0)})</li>"
+        for factor in decision.get("factors", []):
+            parts.append(_FACTOR_TMPL.format_map({
+                "name": _escape(factor.get("name", "Factor")),
+                "value": _escape(factor.get("value", "N/A")),
+                "weight": _escape(factor.get("weight", 0))
+            }))
         
-        html += """
+        context_data = escape(_dumps(context, pretty=True), quote=False)
+        reasoning = _escape(decision.get("reasoning", "No reasoning provided"))
+        parts.append(f"""
                 </ul>
             </div>
             
-            <div style='margin: 15px 0;'>
+            <div class='viz-block'>
                 <h4>Context:</h4>
-                <pre style='background: white; padding: 10px; border-radius: 4px;'>{}</pre>
+                <pre class='viz-pre'>{context_data}</pre>
             </div>
             
-            <div style='margin: 15px 0;'>
+            <div class='viz-block'>
                 <h4>Reasoning:</h4>
-                <p>{}</p>
+                <p>{reasoning}</p>
             </div>
         </div>
-        """.format(
-            json.dumps(context, indent=2),
-            decision.get("reasoning", "No reasoning provided")
-        )
+        """)
         
-        return html
+        return "".join(parts)
     
-    def _display(self, html: str):
-        """Display HTML in appropriate environment."""
-        if self.in_databricks and self.ipython:
-            # Databricks notebook
-            from IPython.display import HTML, display
-            display(HTML(html))
-        elif self.ipython:
-            # Jupyter notebook
-            from IPython.display import HTML, display
-            display(HTML(html))
+    def _display(self, html: Union[str, Iterable[str]]):
+        """
+        Display HTML in appropriate environment.
+        
+        html may be a string or an iterable of chunks; standalone output writes
+        chunks as they come rather than assembling the whole document first.
+        """
+        if self.ipython:
+            # Databricks or Jupyter notebook
+            if self._HTML is None:
+                from IPython.display import HTML, display
+                self._HTML, self._display_fn = HTML, display
+            self._display_fn(self._HTML(html if isinstance(html, str) else "".join(html)))
         else:
             # Standalone - save to file
-            with open("visualization_output.html", "w") as f:
-                f.write(html)
+            with open("visualization_output.html", "w", encoding="utf-8") as f:
+                f.writelines([html] if isinstance(html, str) else html)
             print("Visualization saved to visualization_output.html")
     
     def log_to_mlflow(self, trace: Dict[str, Any], run_id: Optional[str] = None):
@@ -389,21 +773,34 @@ class DatabricksVisualizer:
             run_id: MLflow run ID (uses active run if None)
         """
         try:
-            import mlflow
+            if self._mlflow is None:
+                import mlflow
+                self._mlflow = mlflow
+            mlflow = self._mlflow
             
-            # Generate visualizations
-            graph_html = f"<div class='mermaid'>{self._generate_mermaid(trace)}</div>"
+            # Generate visualizations (cached if already shown for this trace)
+            mermaid_src = self._generate_mermaid(trace)
+            graph_html = _mermaid_div(mermaid_src) + _MERMAID_SCRIPT
+            graph_svg = _render_mermaid_svg(mermaid_src)
             timeline_html = self._generate_timeline_html(trace)
             
             # Log as artifacts
             with mlflow.start_run(run_id=run_id):
                 mlflow.log_text(graph_html, "visualizations/execution_graph.html")
+                if graph_svg is not None:
+                    # Pre-rendered, so the artifact viewer needn't run mermaid.js
+                    mlflow.log_text(graph_svg, "visualizations/execution_graph.svg")
                 mlflow.log_text(timeline_html, "visualizations/timeline.html")
                 
-                # Log metrics
-                actions = trace.get("actions", [])
-                mlflow.log_metric("total_actions", len(actions))
-                mlflow.log_metric("total_duration_ms", sum(a.get("duration_ms", 0) for a in actions))
+                # Log metrics, in one pass over the actions and one request
+                total_actions = total_duration_ms = 0
+                for action in trace.get("actions", []):
+                    total_actions += 1
+                    total_duration_ms += _duration_ms(action)
+                mlflow.log_metrics({
+                    "total_actions": total_actions,
+                    "total_duration_ms": total_duration_ms
+                })
                 
                 print("✅ Visualizations logged to MLflow")
                 